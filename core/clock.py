@@ -1,7 +1,13 @@
 # ============================================================
 # IMPORTS
 # ============================================================
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
 
 
 # ============================================================
@@ -33,18 +39,58 @@ class ReplayClock(Clock):
     """
     Clock implementation for replay/backtesting.
     Time advances only when explicitly set or advanced.
+
+    Time is held either as the datetime last set or as integer nanoseconds
+    since the epoch (set_ns / advance_ns); the other form is only built when
+    asked for, so stepping in nanoseconds never allocates a datetime.
+    Datetimes carry microsecond resolution; sub-microsecond ns are dropped
+    when a datetime is materialized.
     """
     def __init__(self, start_time: datetime):
-        self._current_time = start_time
+        # aware start times keep their tz; the epoch must match awareness
+        self._tz = start_time.tzinfo
+        self._epoch = _EPOCH_UTC if self._tz is not None else _EPOCH_NAIVE
+        self._current_time: Optional[datetime] = start_time
+        self._ns: Optional[int] = None
 
     def now(self) -> datetime:
-        return self._current_time
+        current = self._current_time
+        if current is None:
+            current = self._epoch + timedelta(microseconds=self._ns // 1000)
+            if self._tz is not None and self._tz is not timezone.utc:
+                current = current.astimezone(self._tz)
+            self._current_time = current
+        return current
+
+    def now_ns(self) -> int:
+        """
+        Current time as integer nanoseconds since the epoch.
+        """
+        ns = self._ns
+        if ns is None:
+            ns = (self._current_time - self._epoch) // _ONE_MICROSECOND * 1000
+            self._ns = ns
+        return ns
 
     def set(self, new_time: datetime) -> None:
         self._current_time = new_time
+        self._ns = None
+
+    def set_ns(self, ns: int) -> None:
+        """
+        Set time from integer nanoseconds since the epoch.
+        """
+        self._ns = ns
+        self._current_time = None
 
     def advance(self, delta) -> None:
         """
         Advance time by a timedelta.
         """
-        self._current_time += delta
+        self.set(self.now() + delta)
+
+    def advance_ns(self, ns: int) -> None:
+        """
+        Advance time by integer nanoseconds.
+        """
+        self.set_ns(self.now_ns() + ns)
@@ -2,7 +2,8 @@
 # IMPORTS
 # ============================================================
 
-from typing import List, Set, Optional, Dict
+from types import MappingProxyType
+from typing import AbstractSet, List, Optional, Dict, FrozenSet
 
 
 # ============================================================
@@ -10,7 +11,25 @@ from typing import List, Set, Optional, Dict
 # ============================================================
 
 symbol_universe: List[str] = []                 # user-provided
-manually_omitted_symbols: Optional[Set[str]] = None  # default None
+manually_omitted_symbols: Optional[AbstractSet[str]] = frozenset()  # None is treated as empty
+
+
+def get_universe() -> List[str]:
+    """
+    Current symbol_universe, read at call time so reassignment is picked up.
+    """
+    return symbol_universe
+
+
+def get_omitted() -> FrozenSet[str]:
+    """
+    Current manually_omitted_symbols as a frozenset.
+    Frozen values are returned as-is; None / mutable sets are converted on read.
+    """
+    omitted = manually_omitted_symbols
+    if isinstance(omitted, frozenset):
+        return omitted
+    return frozenset(omitted or ())
 
 
 # ============================================================
@@ -28,7 +47,8 @@ CAP_PRIORITY = ["LARGE", "MID", "SMALL"]
 # DERIVED DATA CONFIG
 # ============================================================
 
-DERIVED_CFG = {
+# read-only; processors snapshot it in refresh_config()
+DERIVED_CFG = MappingProxyType({
     "threshold_pct": 0.25,        # CPR width threshold (%)
     "top_n": 5,                   # tradable symbols count
 
@@ -37,5 +57,5 @@ DERIVED_CFG = {
     "target_max_pct": 20.0,       # %
 
     # Flip ranges (percent values)
-    "flip_steps_pct": [0.0, 0.02, 0.04, 0.05, 0.06, 0.08, 0.10],
-}
+    "flip_steps_pct": (0.0, 0.02, 0.04, 0.05, 0.06, 0.08, 0.10),
+})
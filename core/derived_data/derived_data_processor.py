@@ -2,30 +2,46 @@
 # IMPORTS
 # ============================================================
 
-from datetime import datetime, timezone
-from typing import Dict, List, Set
+import hashlib
+import struct
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
 
+import numpy as np
+
+from core.clock import Clock, RealClock
 from core.event_bus import EventBus
 from core.logger import Logger
 
 from core.derived_data.config import (
-    symbol_universe,
-    manually_omitted_symbols,
+    get_universe,
+    get_omitted,
     symbol_metadata,
-    CAP_PRIORITY,
     DERIVED_CFG,
 )
 
 from core.derived_data.models import (
     DerivedSymbolData,
+    DerivedUniverseColumns,
     DerivedUniverseSnapshot,
     GapSnapshotEvent,
 )
 
 from core.derived_data.derived_data_store import DerivedDataStore
+from core.derived_data.kernels import compute_all, step_multipliers
 from core.events.session_events import SessionStartEvent
 
 
+# ============================================================
+# CONSTANTS
+# ============================================================
+
+# number of distinct pre-market inputs kept in the replay cache
+PRE_MARKET_CACHE_SIZE = 8
+
+_OHLC_STRUCT = struct.Struct("<3d")
+
+
 # ============================================================
 # DERIVED DATA PROCESSOR
 # ============================================================
@@ -47,20 +63,60 @@ class DerivedDataProcessor:
         event_bus: EventBus,
         logger: Logger,
         store: DerivedDataStore,
+        clock: Optional[Clock] = None,
     ):
         self._event_bus = event_bus
         self._logger = logger
         self._store = store
+        # RealClock live; pass a ReplayClock for deterministic snapshot timestamps
+        self._clock = clock if clock is not None else RealClock()
 
         self._effective_universe: List[str] = []
-        self._symbols_missing_prev_day_ohlc: Set[str] = set()
+        # inputs of the last universe_refresh (invalidation key)
+        self._universe_source: Optional[List[str]] = None
+        self._omitted_source: Optional[FrozenSet[str]] = None
+        self._symbols_missing_prev_day_ohlc: List[str] = []
 
         self._filtered_records: List[DerivedSymbolData] = []
         self._tradable_records: List[DerivedSymbolData] = []
+        self._columns: Optional[DerivedUniverseColumns] = None
+
+        # (1 + k) / (1 - k) step multipliers derived from DERIVED_CFG (see refresh_config)
+        self._target_up: np.ndarray = np.empty(0, dtype=np.float64)
+        self._target_down: np.ndarray = np.empty(0, dtype=np.float64)
+        self._flip_up: np.ndarray = np.empty(0, dtype=np.float64)
+        self._flip_down: np.ndarray = np.empty(0, dtype=np.float64)
+        self.refresh_config()
+
+        # input digest -> (columns, filtered, tradable, missing); LRU order
+        self._pre_market_cache: "OrderedDict[bytes, Tuple]" = OrderedDict()
 
         # Subscribe to session start for gap snapshot
         self._event_bus.subscribe(SessionStartEvent, self._on_session_start)
 
+    def refresh_config(self, cfg: Optional[Mapping[str, Any]] = None) -> None:
+        """
+        Snapshot derived-data settings (DERIVED_CFG unless cfg is given) into
+        instance attributes, so the pre-market path never reads the config dict.
+        num_steps and the (1 ± k) factors are computed here only, never per run.
+        """
+        cfg = DERIVED_CFG if cfg is None else cfg
+
+        self._threshold: float = cfg["threshold_pct"]
+        self._top_n: int = cfg["top_n"]
+
+        step = cfg["target_step_pct"] / 100.0
+        # ensure numeric stability: build by integer steps
+        num_steps = int(round((cfg["target_max_pct"] / cfg["target_step_pct"]))) + 1
+        ks_target = np.arange(num_steps, dtype=np.float64) * step
+        ks_flip = np.asarray(cfg["flip_steps_pct"], dtype=np.float64) / 100.0
+
+        self._target_up, self._target_down = step_multipliers(ks_target)
+        self._flip_up, self._flip_down = step_multipliers(ks_flip)
+
+        # config part of the pre-market cache key
+        self._cfg_fingerprint: bytes = repr(sorted(cfg.items())).encode()
+
     # ========================================================
     # UNIVERSE MANAGEMENT
     # ========================================================
@@ -69,8 +125,19 @@ class DerivedDataProcessor:
         """
         Reload symbol_universe and manually_omitted_symbols.
         Preserve the order of symbol_universe so stable sorts remain deterministic.
+        No-op when neither input changed since the last refresh.
         """
-        omitted = set(manually_omitted_symbols or set())
+        symbol_universe = get_universe()
+        omitted = get_omitted()
+        # list == list short-circuits on identical string objects and allocates nothing
+        if (
+            self._universe_source == symbol_universe
+            and (omitted is self._omitted_source or omitted == self._omitted_source)
+        ):
+            return
+        self._universe_source = list(symbol_universe)
+        self._omitted_source = omitted
+
         # preserve symbol_universe order and filter omitted
         self._effective_universe = [s for s in symbol_universe if s not in omitted]
 
@@ -83,105 +150,171 @@ class DerivedDataProcessor:
     # PRE-MARKET CORE LOGIC
     # ========================================================
 
-    def _compute_cpr(self, h: float, l: float, c: float):
-        P = (h + l + c) / 3.0
-        BC = (h + l) / 2.0
-        TC = 2 * P - BC
-        width_pct = abs(TC - BC) / P * 100.0
-        return P, BC, TC, width_pct
-
-    def _compute_target_ranges(self, x: float):
-        step = DERIVED_CFG["target_step_pct"] / 100.0
-        max_k = DERIVED_CFG["target_max_pct"] / 100.0
-
-        ks = []
-        k = 0.0
-        # ensure numeric stability: build by integer steps
-        num_steps = int(round((DERIVED_CFG["target_max_pct"] / DERIVED_CFG["target_step_pct"]))) + 1
-        for i in range(num_steps):
-            ks.append(i * step)
+    def _pre_market_key(self, prev_day_ohlc: Mapping[str, Mapping[str, float]]) -> bytes:
+        """
+        Content digest of everything run_pre_market depends on:
+        effective universe, prev-day H/L/C, symbol metadata and the config snapshot.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._cfg_fingerprint)
 
-        pos = [x * (1 + k) for k in ks]
-        neg = [x * (1 - k) for k in ks]
-        return pos, neg
+        for symbol in self._effective_universe:
+            digest.update(symbol.encode())
+            digest.update(b"\x1f")
+            ohlc = prev_day_ohlc.get(symbol)
+            if ohlc:
+                digest.update(_OHLC_STRUCT.pack(ohlc["high"], ohlc["low"], ohlc["close"]))
+            else:
+                digest.update(b"\x00")
+            digest.update(repr(symbol_metadata.get(symbol)).encode())
 
-    def _compute_flip_ranges(self, x: float):
-        ks = [k / 100.0 for k in DERIVED_CFG["flip_steps_pct"]]
-        pos = [x * (1 + k) for k in ks]
-        neg = [x * (1 - k) for k in ks]
-        return pos, neg
+        return digest.digest()
 
-    def run_pre_market(self, prev_day_ohlc: Dict[str, Dict[str, float]]) -> None:
+    def _build_records(self, prev_day_ohlc: Mapping[str, Mapping[str, float]]) -> None:
         """
-        prev_day_ohlc format:
-        {
-            "RELIANCE": {"high":..., "low":..., "close":...},
-            ...
-        }
+        CPR and target/flip ranges are computed column-wise (SoA) for the
+        whole universe in one pass and kept as DerivedUniverseColumns;
+        each record's ranges are row views into the shared (N, K) matrices.
         """
-
-        self.universe_refresh()
-        self._symbols_missing_prev_day_ohlc.clear()
-        self._filtered_records.clear()
-        self._tradable_records.clear()
+        symbols: List[str] = []
+        rows: List[tuple] = []
 
         for symbol in self._effective_universe:
             ohlc = prev_day_ohlc.get(symbol)
             if not ohlc:
-                self._symbols_missing_prev_day_ohlc.add(symbol)
+                self._symbols_missing_prev_day_ohlc.append(symbol)
                 continue
 
-            h, l, c = ohlc["high"], ohlc["low"], ohlc["close"]
-
-            P, BC, TC, width_pct = self._compute_cpr(h, l, c)
-            target_pos, target_neg = self._compute_target_ranges(c)
-            flip_pos, flip_neg = self._compute_flip_ranges(c)
+            symbols.append(symbol)
+            rows.append((ohlc["high"], ohlc["low"], ohlc["close"]))
+
+        H, L, C = np.array(rows, dtype=np.float64).reshape(-1, 3).T
+
+        n = len(symbols)
+        P = np.empty(n, dtype=np.float64)
+        BC = np.empty(n, dtype=np.float64)
+        TC = np.empty(n, dtype=np.float64)
+        width_pct = np.empty(n, dtype=np.float64)
+        target_pos = np.empty((n, self._target_up.size), dtype=np.float64)
+        target_neg = np.empty((n, self._target_up.size), dtype=np.float64)
+        flip_pos = np.empty((n, self._flip_up.size), dtype=np.float64)
+        flip_neg = np.empty((n, self._flip_up.size), dtype=np.float64)
+
+        compute_all(
+            H, L, C,
+            self._target_up, self._target_down, self._flip_up, self._flip_down,
+            P, BC, TC, width_pct,
+            target_pos, target_neg, flip_pos, flip_neg,
+        )
 
-            record = DerivedSymbolData(
+        # stable C-level sort by CPR width; columns and records follow that order
+        order = np.argsort(width_pct, kind="stable")
+
+        cols = DerivedUniverseColumns(
+            symbols=np.array(symbols, dtype=object)[order],
+            prev_high=H[order],
+            prev_low=L[order],
+            prev_close=C[order],
+            P=P[order],
+            BC=BC[order],
+            TC=TC[order],
+            cpr_width_pct=width_pct[order],
+            target_pos=target_pos[order],
+            target_neg=target_neg[order],
+            flip_pos=flip_pos[order],
+            flip_neg=flip_neg[order],
+        )
+        self._columns = cols
+
+        for i, (symbol, h, l, c, p, bc, tc, width) in enumerate(zip(
+            cols.symbols.tolist(),
+            cols.prev_high.tolist(),
+            cols.prev_low.tolist(),
+            cols.prev_close.tolist(),
+            cols.P.tolist(),
+            cols.BC.tolist(),
+            cols.TC.tolist(),
+            cols.cpr_width_pct.tolist(),
+        )):
+            self._filtered_records.append(DerivedSymbolData(
                 symbol=symbol,
                 prev_high=h,
                 prev_low=l,
                 prev_close=c,
-                P=P,
-                BC=BC,
-                TC=TC,
-                cpr_width_pct=width_pct,
-                target_range_pos=target_pos,
-                target_range_neg=target_neg,
-                flip_range_pos=flip_pos,
-                flip_range_neg=flip_neg,
+                P=p,
+                BC=bc,
+                TC=tc,
+                cpr_width_pct=width,
+                target_range_pos=cols.target_pos[i],
+                target_range_neg=cols.target_neg[i],
+                flip_range_pos=cols.flip_pos[i],
+                flip_range_neg=cols.flip_neg[i],
                 metadata=symbol_metadata.get(symbol, {}),
-            )
+            ))
 
-            # persist per-symbol derived data into store (new)
-            try:
-                self._store.persist_symbol_data(record)
-            except Exception as e:
-                # defensive: log but continue building the in-memory list
-                self._logger.info("[DERIVED] Failed to persist symbol data", symbol=symbol, error=str(e))
+        # Apply threshold + top-N: widths are sorted, so the candidates
+        # below threshold are a prefix of the filtered records
+        below = int(np.searchsorted(cols.cpr_width_pct, self._threshold, side="left"))
+        self._tradable_records = self._filtered_records[:min(below, self._top_n)]
+
+    def run_pre_market(self, prev_day_ohlc: Mapping[str, Mapping[str, float]]) -> None:
+        """
+        prev_day_ohlc format:
+        {
+            "RELIANCE": {"high":..., "low":..., "close":...},
+            ...
+        }
 
-            self._filtered_records.append(record)
+        Results are cached by a digest of the inputs, so replaying a session
+        with identical prev-day data skips the computation entirely.
+        """
 
-        # Sort by CPR width, stable
-        self._filtered_records.sort(key=lambda r: r.cpr_width_pct)
+        self.universe_refresh()
+        # fresh list per run: the previous one is owned by the last snapshot
+        self._symbols_missing_prev_day_ohlc = []
+        self._filtered_records.clear()
+        self._tradable_records.clear()
 
-        # Apply threshold + top-N
-        threshold = DERIVED_CFG["threshold_pct"]
-        top_n = DERIVED_CFG["top_n"]
+        cache_key = self._pre_market_key(prev_day_ohlc)
+        cached = self._pre_market_cache.get(cache_key)
 
-        candidates = [
-            r for r in self._filtered_records
-            if r.cpr_width_pct < threshold
-        ]
+        if cached is None:
+            self._build_records(prev_day_ohlc)
+            self._pre_market_cache[cache_key] = (
+                self._columns,
+                tuple(self._filtered_records),
+                tuple(self._tradable_records),
+                tuple(self._symbols_missing_prev_day_ohlc),
+            )
+            if len(self._pre_market_cache) > PRE_MARKET_CACHE_SIZE:
+                self._pre_market_cache.popitem(last=False)
+        else:
+            self._pre_market_cache.move_to_end(cache_key)
+            self._columns, filtered, tradable, missing = cached
+            self._filtered_records.extend(filtered)
+            self._tradable_records = list(tradable)
+            self._symbols_missing_prev_day_ohlc.extend(missing)
+
+        # persist per-symbol derived data into store (single batch call)
+        try:
+            self._store.persist_symbol_data_batch(self._filtered_records)
+        except Exception as e:
+            # defensive: log but still emit the snapshot
+            self._logger.info(
+                "[DERIVED] Failed to persist symbol data",
+                count=len(self._filtered_records),
+                error=str(e),
+            )
 
-        self._tradable_records = candidates[:top_n]
+        # symbol column is already in filtered order; tradables are its prefix
+        filtered_symbols = self._columns.symbols.tolist()
 
         snapshot = DerivedUniverseSnapshot(
-            timestamp=datetime.now(timezone.utc),
+            timestamp=self._clock.now(),
             effective_universe=self._effective_universe,
-            filtered_symbols=[r.symbol for r in self._filtered_records],
-            tradable_symbols=[r.symbol for r in self._tradable_records],
-            symbols_missing_prev_day_ohlc=list(self._symbols_missing_prev_day_ohlc),
+            filtered_symbols=filtered_symbols,
+            tradable_symbols=filtered_symbols[:len(self._tradable_records)],
+            symbols_missing_prev_day_ohlc=self._symbols_missing_prev_day_ohlc,
         )
 
         # persist snapshot and publish as before
@@ -209,23 +342,28 @@ class DerivedDataProcessor:
             self._logger.info("[DERIVED] No tradables at session start; skipping gap snapshot.")
             return
 
-        gaps: Dict[str, Dict[str, float]] = {}
+        # tradables are the leading rows of the width-ordered columns
+        n = len(self._tradable_records)
+        prev_close = self._columns.prev_close[:n]
+        today_open = event.session_context.today_open
 
-        for record in self._tradable_records:
-            prev_close = record.prev_close
-            today_open = event.session_context.today_open
+        gap_pct = ((today_open - prev_close) / prev_close) * 100.0
+        gap_pct_abs = np.abs(gap_pct)
 
-            gap_pct = ((today_open - prev_close) / prev_close) * 100.0
-            gaps[record.symbol] = {
-                "prev_close": prev_close,
+        gaps: Dict[str, Dict[str, float]] = {
+            symbol: {
+                "prev_close": pc,
                 "today_open": today_open,
-                "gap_pct": gap_pct,
-                "gap_pct_abs": abs(gap_pct),
+                "gap_pct": g,
+                "gap_pct_abs": ga,
             }
-
-        if not gaps:
-            self._logger.info("[DERIVED] No gap data computed; skipping emit.")
-            return
+            for symbol, pc, g, ga in zip(
+                self._columns.symbols[:n].tolist(),
+                prev_close.tolist(),
+                gap_pct.tolist(),
+                gap_pct_abs.tolist(),
+            )
+        }
 
         gap_event = GapSnapshotEvent(
             timestamp=event.timestamp,
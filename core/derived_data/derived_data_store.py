@@ -2,15 +2,25 @@
 # IMPORTS
 # ============================================================
 
-from datetime import datetime
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from core.derived_data.models import DerivedSymbolData, DerivedUniverseSnapshot, GapSnapshotEvent
 
 # ============================================================
 # STORAGE INTERFACE / IN-MEMORY IMPLEMENTATION
 # ============================================================
 
+def _level_at(levels: np.ndarray, step_index: int) -> Optional[float]:
+    """
+    Bounds-checked read of one price level; None when out of range.
+    """
+    if 0 <= step_index < levels.size:
+        return float(levels[step_index])
+    return None
+
+
 class DerivedDataStore:
     """
     Interface / contract for storing derived-data artifacts.
@@ -20,6 +30,14 @@ class DerivedDataStore:
     def persist_symbol_data(self, symbol_data: DerivedSymbolData) -> None:
         raise NotImplementedError
 
+    def persist_symbol_data_batch(self, records: List[DerivedSymbolData]) -> None:
+        """
+        Persist many records in one call. Default loops; DB-backed stores
+        should override with a single bulk write (executemany / COPY).
+        """
+        for record in records:
+            self.persist_symbol_data(record)
+
     def get_symbol_data(self, symbol: str) -> Optional[DerivedSymbolData]:
         raise NotImplementedError
 
@@ -33,6 +51,18 @@ class DerivedDataStore:
     def get_target_by_step(self, symbol: str, step_index: int, side: str = "pos") -> Optional[float]:
         raise NotImplementedError
 
+    def get_targets_batch(
+        self, symbol: str, steps: np.ndarray, side: str = "pos"
+    ) -> Optional[np.ndarray]:
+        """
+        Target levels for many steps at once; NaN where a step is out of range.
+        Default loops over get_target_by_step; array-backed stores should override.
+        """
+        if self.get_symbol_data(symbol) is None:
+            return None
+        levels = [self.get_target_by_step(symbol, int(step), side=side) for step in steps]
+        return np.array([np.nan if level is None else level for level in levels], dtype=np.float64)
+
     def get_flip_for_step(self, symbol: str, step_index: int, side: str = "pos") -> Optional[float]:
         raise NotImplementedError
 
@@ -60,6 +90,9 @@ class InMemoryDerivedDataStore(DerivedDataStore):
     def persist_symbol_data(self, symbol_data: DerivedSymbolData) -> None:
         self._symbols[symbol_data.symbol] = symbol_data
 
+    def persist_symbol_data_batch(self, records: List[DerivedSymbolData]) -> None:
+        self._symbols.update((record.symbol, record) for record in records)
+
     def get_symbol_data(self, symbol: str) -> Optional[DerivedSymbolData]:
         return self._symbols.get(symbol)
 
@@ -69,6 +102,14 @@ class InMemoryDerivedDataStore(DerivedDataStore):
     def persist_gap_snapshot(self, gap_event: GapSnapshotEvent) -> None:
         self.gap_snapshots.append(gap_event)
 
+    def reset(self) -> None:
+        """
+        Drop all stored data in place (containers are reused).
+        """
+        self._symbols.clear()
+        self.universe_snapshots.clear()
+        self.gap_snapshots.clear()
+
     # ---------------------------
     # helpers (accessors)
     # ---------------------------
@@ -77,25 +118,28 @@ class InMemoryDerivedDataStore(DerivedDataStore):
         record = self.get_symbol_data(symbol)
         if not record:
             return None
-        if side == "pos":
-            if 0 <= step_index < len(record.target_range_pos):
-                return record.target_range_pos[step_index]
-        else:
-            if 0 <= step_index < len(record.target_range_neg):
-                return record.target_range_neg[step_index]
-        return None
+        levels = record.target_range_pos if side == "pos" else record.target_range_neg
+        return _level_at(levels, step_index)
+
+    def get_targets_batch(
+        self, symbol: str, steps: np.ndarray, side: str = "pos"
+    ) -> Optional[np.ndarray]:
+        record = self.get_symbol_data(symbol)
+        if not record:
+            return None
+        levels = record.target_range_pos if side == "pos" else record.target_range_neg
+        steps = np.asarray(steps, dtype=np.intp)
+        out = np.full(steps.shape, np.nan)
+        valid = (steps >= 0) & (steps < levels.size)
+        out[valid] = levels[steps[valid]]
+        return out
 
     def get_flip_for_step(self, symbol: str, step_index: int, side: str = "pos") -> Optional[float]:
         record = self.get_symbol_data(symbol)
         if not record:
             return None
-        if side == "pos":
-            if 0 <= step_index < len(record.flip_range_pos):
-                return record.flip_range_pos[step_index]
-        else:
-            if 0 <= step_index < len(record.flip_range_neg):
-                return record.flip_range_neg[step_index]
-        return None
+        levels = record.flip_range_pos if side == "pos" else record.flip_range_neg
+        return _level_at(levels, step_index)
 
     def get_stop_for_step(self, symbol: str, step_index: int, side: str = "pos") -> Optional[float]:
         """
@@ -121,5 +165,6 @@ class InMemoryDerivedDataStore(DerivedDataStore):
         target_pct = (target_price / prev_close) - 1.0  # could be negative for neg side
 
         # stop is opposite sign percentage from prev_close
-        stop_price = prev_close * (1.0 - target_pct)  # if target_pct positive, this yields below prev_close
+        # if target_pct positive, this yields below prev_close
+        stop_price = prev_close * (1.0 - target_pct)
         return stop_price
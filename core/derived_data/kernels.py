@@ -0,0 +1,88 @@
+# ============================================================
+# IMPORTS
+# ============================================================
+
+import numpy as np
+
+# Numba is optional: when it is not installed the same kernel runs as
+# whole-array NumPy operations with identical results.
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None  # type: ignore
+    prange = range  # type: ignore
+
+
+# ============================================================
+# PRE-MARKET KERNEL
+# ============================================================
+
+# H, L, C, target_up, target_down, flip_up, flip_down,
+# P, BC, TC, width, target_pos, target_neg, flip_pos, flip_neg
+COMPUTE_ALL_SIGNATURE = (
+    "void(f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:],"
+    " f8[:, :], f8[:, :], f8[:, :], f8[:, :])"
+)
+
+
+def step_multipliers(ks: np.ndarray):
+    """
+    (1 + k, 1 - k) per step, computed once per config so the kernels do a
+    single multiply per output level.
+    """
+    return 1.0 + ks, 1.0 - ks
+
+
+def _compute_all_numpy(H, L, C, target_up, target_down, flip_up, flip_down,
+                       P, BC, TC, width,
+                       target_pos, target_neg, flip_pos, flip_neg) -> None:
+    """
+    Reference implementation: CPR + target/flip ranges for N symbols,
+    written into the preallocated output arrays.
+    """
+    P[:] = (H + L + C) / 3.0
+    BC[:] = (H + L) / 2.0
+    TC[:] = 2 * P - BC
+    width[:] = np.abs(TC - BC) / P * 100.0
+
+    close = C[:, None]
+    np.multiply(close, target_up, out=target_pos)
+    np.multiply(close, target_down, out=target_neg)
+    np.multiply(close, flip_up, out=flip_pos)
+    np.multiply(close, flip_down, out=flip_neg)
+
+
+def _compute_all_loop(H, L, C, target_up, target_down, flip_up, flip_down,
+                      P, BC, TC, width,
+                      target_pos, target_neg, flip_pos, flip_neg) -> None:
+    """
+    Scalar-loop form of the same kernel, compiled by Numba (parallel over symbols).
+    No fastmath: results must stay bit-identical for replay.
+    """
+    for i in prange(H.shape[0]):
+        high = H[i]
+        low = L[i]
+        close = C[i]
+
+        p = (high + low + close) / 3.0
+        bc = (high + low) / 2.0
+        tc = 2 * p - bc
+
+        P[i] = p
+        BC[i] = bc
+        TC[i] = tc
+        width[i] = abs(tc - bc) / p * 100.0
+
+        for j in range(target_up.shape[0]):
+            target_pos[i, j] = close * target_up[j]
+            target_neg[i, j] = close * target_down[j]
+
+        for j in range(flip_up.shape[0]):
+            flip_pos[i, j] = close * flip_up[j]
+            flip_neg[i, j] = close * flip_down[j]
+
+
+if njit is not None:
+    compute_all = njit(COMPUTE_ALL_SIGNATURE, cache=True, parallel=True)(_compute_all_loop)
+else:
+    compute_all = _compute_all_numpy
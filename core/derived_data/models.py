@@ -3,20 +3,24 @@
 # ============================================================
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
-from datetime import datetime, date
+from typing import Dict, List, Any
+from datetime import datetime
+
+import numpy as np
 
 # ============================================================
 # DERIVED SYMBOL DATA
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class DerivedSymbolData:
     """
     Per-symbol derived snapshot computed pre-market.
 
-    - target_range_pos / neg: list of absolute price levels (index => step_index).
-    - flip_range_pos / neg: list of absolute price levels (index => flip step index).
+    - target_range_pos / neg: float64 array of absolute price levels (index => step_index).
+    - flip_range_pos / neg: float64 array of absolute price levels (index => flip step index).
+      Lists are accepted and coerced on construction; float64 buffers such as
+      array('d') are wrapped without a copy.
     - prev_close is kept for reference and for stop-price derivation helpers.
     - metadata: operator-editable dictionary (cap category, lot_size, etc.)
     """
@@ -30,18 +34,55 @@ class DerivedSymbolData:
     TC: float
     cpr_width_pct: float
 
-    target_range_pos: List[float] = field(default_factory=list)
-    target_range_neg: List[float] = field(default_factory=list)
-    flip_range_pos: List[float] = field(default_factory=list)
-    flip_range_neg: List[float] = field(default_factory=list)
+    target_range_pos: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    target_range_neg: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    flip_range_pos: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    flip_range_neg: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
 
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        # no copy when the processor already hands over float64 rows
+        self.target_range_pos = np.asarray(self.target_range_pos, dtype=np.float64)
+        self.target_range_neg = np.asarray(self.target_range_neg, dtype=np.float64)
+        self.flip_range_pos = np.asarray(self.flip_range_pos, dtype=np.float64)
+        self.flip_range_neg = np.asarray(self.flip_range_neg, dtype=np.float64)
+
+# ============================================================
+# DERIVED UNIVERSE COLUMNS (SoA)
+# ============================================================
+
+@dataclass(slots=True)
+class DerivedUniverseColumns:
+    """
+    Column-oriented view of one pre-market run, rows in CPR-width order
+    (row i <=> i-th filtered record, so tradables are a row prefix).
+
+    - symbols: object array of symbol names, length N.
+    - prev_* / P / BC / TC / cpr_width_pct: float64 arrays, length N.
+    - target_* / flip_*: float64 matrices of shape (N, K); row i backs the
+      range arrays of the i-th DerivedSymbolData.
+    """
+    symbols: np.ndarray
+    prev_high: np.ndarray
+    prev_low: np.ndarray
+    prev_close: np.ndarray
+
+    P: np.ndarray
+    BC: np.ndarray
+    TC: np.ndarray
+    cpr_width_pct: np.ndarray
+
+    target_pos: np.ndarray
+    target_neg: np.ndarray
+    flip_pos: np.ndarray
+    flip_neg: np.ndarray
+
 # ============================================================
 # SNAPSHOT / EVENTS (lightweight outline)
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class DerivedUniverseSnapshot:
     timestamp: datetime
     effective_universe: List[str]
@@ -50,7 +91,7 @@ class DerivedUniverseSnapshot:
     symbols_missing_prev_day_ohlc: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class GapSnapshotEvent:
     timestamp: datetime
     gaps: Dict[str, Dict[str, float]]
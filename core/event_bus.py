@@ -2,8 +2,21 @@
 # IMPORTS
 # ============================================================
 
-from collections import defaultdict
-from typing import Callable, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+# sentinel for the single-argument publish(event) form
+_NO_PAYLOAD = object()
+
+
+def _dispatch_entry(handlers: Tuple[Callable, ...]) -> Any:
+    """
+    A lone handler is stored bare so dispatch can call it without a loop;
+    anything else (including no handlers) stays a tuple.
+    """
+    if len(handlers) == 1:
+        return handlers[0]
+    return handlers
 
 
 # ============================================================
@@ -12,29 +25,175 @@ from typing import Callable, Dict, List
 
 class EventBus:
     def __init__(self):
-        # event_type -> list of handlers
-        self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        # subscription key (event class or topic name) -> frozen tuple of handlers
+        self._subscribers: Dict[Any, Tuple[Callable, ...]] = {}
+
+        # topic -> dispatch entry: the handler itself when there is exactly
+        # one, else the handler tuple; rebuilt with _subscribers
+        self._topics: Dict[Any, Any] = {}
+
+        # channel handles: topic -> small int, and per channel the same
+        # dispatch entry as _topics, kept in step with it
+        self._channel_ids: Dict[Any, int] = {}
+        self._channels: List[Any] = []
+
+        # concrete event class -> dispatch entry for it and its base classes,
+        # resolved on first publish and dropped on every subscribe
+        self._resolved: Dict[type, Any] = {}
         print("[OK] EventBus initialized")
 
     # ========================================================
     # SUBSCRIPTION API
     # ========================================================
 
-    def subscribe(self, event_type: str, handler: Callable) -> None:
+    def subscribe(self, event_type: Any, handler: Callable) -> None:
+        """
+        Register a handler for an event class or a topic name.
+
+        Class subscriptions also receive instances of subclasses.
         """
-        Register a handler for a given event type.
+        handlers = self._subscribers.get(event_type, ()) + (handler,)
+        self._subscribers[event_type] = handlers
+        self._set_topic_entry(event_type, _dispatch_entry(handlers))
+        self._resolved.clear()
+
+    def unsubscribe(self, event_type: Any, handler: Callable) -> None:
+        """
+        Remove one registration of a handler; unknown handlers are ignored.
         """
-        self._subscribers[event_type].append(handler)
-    
+        handlers = self._subscribers.get(event_type, ())
+        if handler not in handlers:
+            return
+
+        i = handlers.index(handler)
+        remaining = handlers[:i] + handlers[i + 1:]
+        if remaining:
+            self._subscribers[event_type] = remaining
+            self._set_topic_entry(event_type, _dispatch_entry(remaining))
+        else:
+            del self._subscribers[event_type]
+            self._set_topic_entry(event_type, None)
+        self._resolved.clear()
+
+    def reset(self) -> None:
+        """
+        Drop every subscription, clearing the tables in place.
+        Channel handles stay valid and dispatch to nobody until resubscribed.
+        """
+        self._subscribers.clear()
+        self._topics.clear()
+        self._resolved.clear()
+        channels = self._channels
+        for ch in range(len(channels)):
+            channels[ch] = ()
+
+    def channel(self, topic: Any) -> int:
+        """
+        Stable small-int handle for a topic, for publish_ch.
+
+        Resolve it once at producer init; later subscribe/unsubscribe calls
+        on the topic are reflected in the channel.
+        """
+        ch = self._channel_ids.get(topic)
+        if ch is None:
+            ch = len(self._channels)
+            self._channel_ids[topic] = ch
+            self._channels.append(self._topics.get(topic, ()))
+        return ch
+
     # ========================================================
     # PUBLISH API
     # ========================================================
 
-    def publish(self, event_type: str, payload) -> None:
+    def publish(self, event_type: Any, payload: Any = _NO_PAYLOAD) -> None:
         """
         Publish an event to all subscribed handlers.
+
+        - publish(event): dispatch on type(event) (and its base classes)
+        - publish(topic, payload): dispatch on the topic key
+        """
+        if payload is _NO_PAYLOAD:
+            self.publish_event(event_type)
+        else:
+            self.publish_topic(event_type, payload)
+
+    def publish_topic(self, topic: Any, payload: Any) -> None:
         """
-        handlers = self._subscribers.get(event_type, [])
+        Publish a payload to the handlers of one topic name.
+        Monomorphic fast path for hot call sites (ticks, candle updates).
+        """
+        entry = self._topics.get(topic)
+        if entry is None:
+            return
+        if entry.__class__ is tuple:
+            for handler in entry:
+                handler(payload)
+        else:
+            entry(payload)
+
+    def publish_ch(self, ch: int, payload: Any) -> None:
+        """
+        publish_topic by channel handle: a list index instead of a dict
+        lookup on the topic key.
+        """
+        entry = self._channels[ch]
+        if entry.__class__ is tuple:
+            for handler in entry:
+                handler(payload)
+        else:
+            entry(payload)
+
+    def publish_many(self, topic: Any, payloads: Iterable[Any]) -> None:
+        """
+        Publish a batch of payloads to one topic, resolving handlers once.
+        """
+        handlers = self._subscribers.get(topic, ())
+        for payload in payloads:
+            for handler in handlers:
+                handler(payload)
+
+    def publish_event(self, event: Any) -> None:
+        """
+        Publish an event object to handlers of its class and base classes.
+        """
+        event_cls = type(event)
+        entry = self._resolved.get(event_cls)
+        if entry is None:
+            entry = self._resolve(event_cls)
+
+        if entry.__class__ is tuple:
+            for handler in entry:
+                handler(event)
+        else:
+            entry(event)
+
+    # ========================================================
+    # INTERNAL HELPERS
+    # ========================================================
+
+    def _set_topic_entry(self, topic: Any, entry: Any) -> None:
+        """
+        Store a topic's dispatch entry (None: no subscribers left) and
+        mirror it into the topic's channel, if one was handed out.
+        """
+        if entry is None:
+            self._topics.pop(topic, None)
+        else:
+            self._topics[topic] = entry
+
+        ch = self._channel_ids.get(topic)
+        if ch is not None:
+            self._channels[ch] = () if entry is None else entry
+
+    def _resolve(self, event_cls: type) -> Any:
+        """
+        Collect handlers along the MRO once per concrete event class.
+        """
+        handlers: Tuple[Callable, ...] = ()
+        for base in event_cls.__mro__:
+            handlers += self._subscribers.get(base, ())
+
+        entry = _dispatch_entry(handlers)
+        self._resolved[event_cls] = entry
+        return entry
 
-        for handler in handlers:
-            handler(payload)
@@ -0,0 +1,63 @@
+# ============================================================
+# IMPORTS
+# ============================================================
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import NamedTuple
+
+# ============================================================
+# CANDLE EVENTS
+# ============================================================
+
+
+class CandleUpdateEvent(NamedTuple):
+    """
+    Immutable snapshot of an in-progress candle, published on the
+    "CandleUpdateEvent" topic after every tick. Safe to keep without copying.
+    """
+    symbol: str
+    timeframe: str
+    start_time: datetime
+    end_time: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+class Candle(NamedTuple):
+    """
+    Bare timestamped OHLC bar: the minimal shape SessionBoundaryDetector
+    reads from a closed candle (timestamp, open, high, low, close).
+    """
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+
+
+@dataclass(slots=True)
+class CandleClosedEvent:
+    """
+    Emitted by CandleBuilder once a candle's timeframe has elapsed.
+
+    Carries the finalized OHLCV for [start_time, end_time). Consumers
+    that only need a point in time (e.g. SessionBoundaryDetector) use
+    `timestamp`, which is the candle's start_time.
+    """
+    symbol: str
+    timeframe: str
+    start_time: datetime
+    end_time: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+    @property
+    def timestamp(self) -> datetime:
+        return self.start_time
@@ -3,7 +3,7 @@
 # ============================================================
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
 # ============================================================
@@ -12,10 +12,16 @@ from typing import Optional
 
 @dataclass
 class OrderFillEvent:
+    """
+    Fill notification for an order placed on behalf of an intent.
+
+    timestamp is stamped by the emitter from its injected Clock
+    (None until stamped), so fills stay replay-deterministic.
+    """
     intent_id: Optional[str]
     order_id: Optional[str] = None
     symbol: Optional[str] = None
     side: Optional[str] = None
     qty: Optional[float] = None
     price: Optional[float] = None
-    timestamp: datetime = datetime.now(timezone.utc)
+    timestamp: Optional[datetime] = None
@@ -12,7 +12,7 @@ from core.session.session_context import SessionContext
 # ============================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SessionStartEvent:
     """
     Emitted exactly once at the start of each trading session.
@@ -25,7 +25,7 @@ class SessionStartEvent:
     session_context: SessionContext
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SessionEndEvent:
     """
     Emitted exactly once at the end of each trading session.
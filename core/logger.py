@@ -3,7 +3,73 @@
 # ============================================================
 
 import logging
-from typing import Any
+import os
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, Union
+
+
+# per-tick log lines are emitted unless this is set to "0" (replay / backtest)
+LOG_TICKS_ENV = "AG_LOG_TICKS"
+
+# correlation id shared by every Logger in the current thread / async task;
+# read once per emitted line ("" = none)
+_CID: ContextVar[str] = ContextVar("cid", default="")
+_get_cid = _CID.get
+
+
+# ============================================================
+# LAZY MESSAGE
+# ============================================================
+
+class _LazyMessage:
+    """
+    Deferred "message | cid=... k=v" string.
+    Only rendered if a handler actually emits the record.
+    """
+
+    __slots__ = ("_message", "_correlation_id", "_context")
+
+    def __init__(self, message: str, correlation_id, context: dict):
+        self._message = message
+        self._correlation_id = correlation_id
+        self._context = context
+
+    def __str__(self) -> str:
+        return _format_inline(self._message, self._correlation_id, self._context)
+
+
+def _format_inline(message: str, correlation_id, context: dict) -> str:
+    parts = []
+
+    if correlation_id:
+        parts.append(f"cid={correlation_id}")
+
+    if context:
+        context_str = " ".join(
+            f"{key}={value}" for key, value in context.items()
+        )
+        parts.append(context_str)
+
+    if parts:
+        return f"{message} | " + " ".join(parts)
+
+    return message
+
+
+def _discard(*args: Any) -> None:
+    return None
+
+
+def tick_logger(logger: Any) -> Callable[..., None]:
+    """
+    Resolve the callable used for per-tick log lines, once at component init.
+
+    Returns logger.log_tick (message, symbol, price, volume, timestamp),
+    or a no-op when AG_LOG_TICKS=0 so the tick path pays nothing.
+    """
+    if os.environ.get(LOG_TICKS_ENV, "1") == "0":
+        return _discard
+    return logger.log_tick
 
 
 # ============================================================
@@ -26,8 +92,6 @@ class Logger:
             handler.setFormatter(formatter)
             self._logger.addHandler(handler)
             self._logger.setLevel(logging.INFO)
-        
-        self._correlation_id = None
 
 
     # ========================================================
@@ -35,19 +99,85 @@ class Logger:
     # ========================================================
 
     def info(self, message: str, **context: Any) -> None:
-        self._logger.info(self._format(message, context))
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("%s", _LazyMessage(message, _get_cid(), context))
 
     def warning(self, message: str, **context: Any) -> None:
-        self._logger.warning(self._format(message, context))
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning("%s", _LazyMessage(message, _get_cid(), context))
 
     def error(self, message: str, **context: Any) -> None:
-        self._logger.error(self._format(message, context))
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error("%s", _LazyMessage(message, _get_cid(), context))
+
+    def info_kv(
+        self,
+        message: str,
+        key1: Optional[str] = None,
+        val1: Any = None,
+        key2: Optional[str] = None,
+        val2: Any = None,
+    ) -> None:
+        """
+        INFO line with up to two context pairs passed positionally; same
+        output as info(message, key1=val1, key2=val2) without a kwargs dict.
+        """
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
+        cid = _get_cid()
+        if key1 is None:
+            self.info(message)
+        elif key2 is None:
+            if cid:
+                self._logger.info("%s | cid=%s %s=%s", message, cid, key1, val1)
+            else:
+                self._logger.info("%s | %s=%s", message, key1, val1)
+        elif cid:
+            self._logger.info("%s | cid=%s %s=%s %s=%s", message, cid, key1, val1, key2, val2)
+        else:
+            self._logger.info("%s | %s=%s %s=%s", message, key1, val1, key2, val2)
+
+    def log_tick(
+        self, message: str, symbol: str, price: float, volume: int, timestamp: Any
+    ) -> None:
+        """
+        Positional per-tick INFO line; same output as info(message, symbol=..., ...)
+        without building a kwargs dict. Formatting is left to logging.
+        """
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
+        cid = _get_cid()
+        if cid:
+            self._logger.info(
+                "%s | cid=%s symbol=%s price=%s volume=%s timestamp=%s",
+                message, cid, symbol, price, volume, timestamp,
+            )
+        else:
+            self._logger.info(
+                "%s | symbol=%s price=%s volume=%s timestamp=%s",
+                message, symbol, price, volume, timestamp,
+            )
+
+    def enabled_for(self, level: Union[str, int]) -> bool:
+        """
+        True if a record at the level ("INFO", "ERROR", ... or a logging
+        int level) would be emitted. Unknown level names raise ValueError.
+        """
+        if isinstance(level, str):
+            levelno = logging.getLevelNamesMapping().get(level)
+            if levelno is None:
+                raise ValueError(f"unknown log level name: {level!r}")
+            level = levelno
+        return self._logger.isEnabledFor(level)
 
     def set_correlation_id(self, correlation_id: str) -> None:
         """
         Set correlation ID for subsequent logs.
+
+        Stored in a ContextVar, so it applies to every Logger in the current
+        thread / async task and does not leak into others.
         """
-        self._correlation_id = correlation_id
+        _CID.set(correlation_id)
 
 
     # ========================================================
@@ -55,19 +185,4 @@ class Logger:
     # ========================================================
 
     def _format(self, message: str, context: dict) -> str:
-        parts = []
-
-        if self._correlation_id:
-            parts.append(f"cid={self._correlation_id}")
-
-        if context:
-            context_str = " ".join(
-                f"{key}={value}" for key, value in context.items()
-            )
-            parts.append(context_str)
-
-        if parts:
-            return f"{message} | " + " ".join(parts)
-
-        return message
-
+        return _format_inline(message, _get_cid(), context)
@@ -0,0 +1,93 @@
+# ============================================================
+# IMPORTS
+# ============================================================
+
+import numpy as np
+
+# Numba is optional: when it is not installed the same kernel runs as
+# whole-array NumPy operations with identical results.
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # type: ignore
+
+
+# ============================================================
+# SESSION SEGMENT KERNEL
+# ============================================================
+
+# ts_ordinal, open, high, low, close -> (start_idx, end_idx, ohlc)
+SESSION_SEGMENTS_SIGNATURE = "Tuple((i8[:], i8[:], f8[:, :]))(i8[:], f8[:], f8[:], f8[:], f8[:])"
+
+
+def _session_segments_numpy(ts_ord, o, h, lo, c):
+    """
+    Reference implementation: split a time-ordered candle stream into runs
+    of equal day ordinal. Returns the first and last candle index of each
+    run and its (open, high, low, close).
+    """
+    n = ts_ord.shape[0]
+    if n == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty((0, 4))
+
+    boundary = np.empty(n, dtype=np.bool_)
+    boundary[0] = True
+    boundary[1:] = ts_ord[1:] != ts_ord[:-1]
+
+    start_idx = np.flatnonzero(boundary).astype(np.int64)
+    end_idx = np.append(start_idx[1:], n).astype(np.int64) - 1
+
+    ohlc = np.empty((start_idx.shape[0], 4))
+    ohlc[:, 0] = o[start_idx]
+    ohlc[:, 1] = np.maximum.reduceat(h, start_idx)
+    ohlc[:, 2] = np.minimum.reduceat(lo, start_idx)
+    ohlc[:, 3] = c[end_idx]
+    return start_idx, end_idx, ohlc
+
+
+def _session_segments_loop(ts_ord, o, h, lo, c):
+    """
+    Scalar-loop form of the same kernel, compiled by Numba: one pass to
+    size the outputs, one pass to fold each run into four scalars.
+    """
+    n = ts_ord.shape[0]
+    if n == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty((0, 4))
+
+    segments = 1
+    for i in range(1, n):
+        if ts_ord[i] != ts_ord[i - 1]:
+            segments += 1
+
+    start_idx = np.empty(segments, dtype=np.int64)
+    end_idx = np.empty(segments, dtype=np.int64)
+    ohlc = np.empty((segments, 4))
+
+    k = 0
+    start_idx[0] = 0
+    ohlc[0, 0] = o[0]
+    ohlc[0, 1] = h[0]
+    ohlc[0, 2] = lo[0]
+    for i in range(1, n):
+        if ts_ord[i] != ts_ord[i - 1]:
+            end_idx[k] = i - 1
+            ohlc[k, 3] = c[i - 1]
+            k += 1
+            start_idx[k] = i
+            ohlc[k, 0] = o[i]
+            ohlc[k, 1] = h[i]
+            ohlc[k, 2] = lo[i]
+        else:
+            if h[i] > ohlc[k, 1]:
+                ohlc[k, 1] = h[i]
+            if lo[i] < ohlc[k, 2]:
+                ohlc[k, 2] = lo[i]
+    end_idx[k] = n - 1
+    ohlc[k, 3] = c[n - 1]
+    return start_idx, end_idx, ohlc
+
+
+if njit is not None:
+    session_segments = njit(SESSION_SEGMENTS_SIGNATURE, cache=True)(_session_segments_loop)
+else:
+    session_segments = _session_segments_numpy
@@ -2,11 +2,28 @@
 # IMPORTS
 # ============================================================
 
-from datetime import date
-from typing import Optional
+from dataclasses import replace
+from datetime import date, datetime
+from typing import Callable, Optional, Sequence, Union
 
+import numpy as np
+
+from core.events.candle_events import CandleClosedEvent
 from core.session.session_context import SessionContext
 from core.events.session_events import SessionStartEvent, SessionEndEvent
+from core.session.kernels import session_segments
+
+# offset from datetime64[D] day numbers (days since 1970-01-01) to date ordinals
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _datetime64_at(timestamps: np.ndarray) -> Callable[[int], datetime]:
+    """
+    Indexer returning the i-th datetime64 as a naive datetime (microseconds).
+    """
+    as_us = timestamps.astype("datetime64[us]")
+    return lambda i: as_us[i].item()
+
 
 # ============================================================
 # SESSION BOUNDARY DETECTOR
@@ -19,6 +36,19 @@ class SessionBoundaryDetector:
     Pure timestamp-based logic. Deterministic for Fake / Replay / Live.
     """
 
+    __slots__ = (
+        "_event_bus",
+        "_logger",
+        "_active_session_date",
+        "_active_session_ordinal",
+        "_active_session_context",
+        "_prev_day_open",
+        "_prev_day_high",
+        "_prev_day_low",
+        "_prev_day_close",
+        "_last_candle_timestamp",
+    )
+
     # ========================================================
     # SETUP & WIRING
     # ========================================================
@@ -28,6 +58,8 @@ class SessionBoundaryDetector:
 
         # active session state
         self._active_session_date: Optional[date] = None
+        # proleptic ordinal of the active session date; -1 before the first candle
+        self._active_session_ordinal: int = -1
         self._active_session_context: Optional[SessionContext] = None
 
         # rolling previous-day OHLC (accumulated during a session)
@@ -40,7 +72,7 @@ class SessionBoundaryDetector:
         self._last_candle_timestamp = None
 
         # Wiring: subscribe to CandleClosedEvent
-        self._event_bus.subscribe("CandleClosedEvent", self.on_candle_closed)
+        self._event_bus.subscribe(CandleClosedEvent, self.on_candle_closed)
 
     # ========================================================
     # CORE DETECTION LOGIC
@@ -53,15 +85,95 @@ class SessionBoundaryDetector:
         """
 
         candle_ts = event.timestamp
-        candle_date = candle_ts.date()
+        candle_ordinal = candle_ts.toordinal()
 
-        candle_open = event.open
-        candle_high = event.high
-        candle_low = event.low
-        candle_close = event.close
+        # CASE 2 — same session (just update rolling OHLC candidate)
+        # hot path: integer compare, no date object allocated
+        if candle_ordinal == self._active_session_ordinal:
+            # rolling update for previous-day OHLC candidate
+            # note: prev_day_* were seeded at session start (bootstrap or previous)
+            candle_high = event.high
+            if candle_high > self._prev_day_high:
+                self._prev_day_high = candle_high
+            candle_low = event.low
+            if candle_low < self._prev_day_low:
+                self._prev_day_low = candle_low
+            self._prev_day_close = event.close
+
+            self._last_candle_timestamp = candle_ts
+            return
+
+        self._start_session(
+            candle_ts, candle_ordinal, event.open, event.high, event.low, event.close
+        )
+
+    def on_candles(
+        self, timestamps: Union[Sequence[datetime], np.ndarray], opens, highs, lows, closes
+    ) -> None:
+        """
+        Batch form of on_candle_closed for a time-ordered run of candles
+        (replay / backtest). Session runs and their OHLC are found by the
+        session_segments kernel; events are then published per session,
+        identical to feeding the candles one at a time.
+
+        timestamps may be datetimes or a (naive) datetime64 array; with an
+        array, day ordinals come from one astype and only the candles that
+        open or close a run are converted to datetime for the events.
+        """
+        n = len(timestamps)
+        if n == 0:
+            return
+
+        if isinstance(timestamps, np.ndarray):
+            ts_ord = timestamps.astype("datetime64[D]").astype(np.int64) + _UNIX_EPOCH_ORDINAL
+            timestamp_at = _datetime64_at(timestamps)
+        else:
+            ts_ord = np.fromiter((ts.toordinal() for ts in timestamps), dtype=np.int64, count=n)
+            timestamp_at = timestamps.__getitem__
+
+        o = np.asarray(opens, dtype=np.float64)
+        h = np.asarray(highs, dtype=np.float64)
+        lo = np.asarray(lows, dtype=np.float64)
+        c = np.asarray(closes, dtype=np.float64)
+        start_idx, end_idx, ohlc = session_segments(ts_ord, o, h, lo, c)
+
+        for start, end, (_, high, low, close) in zip(
+            start_idx.tolist(), end_idx.tolist(), ohlc.tolist()
+        ):
+            ordinal = int(ts_ord[start])
+            if ordinal == self._active_session_ordinal:
+                # run continues the active session: fold into the rolling OHLC
+                if high > self._prev_day_high:
+                    self._prev_day_high = high
+                if low < self._prev_day_low:
+                    self._prev_day_low = low
+                self._prev_day_close = close
+            else:
+                self._start_session(
+                    timestamp_at(start), ordinal,
+                    o[start].item(), h[start].item(), lo[start].item(), c[start].item(),
+                )
+                # the rest of the run only moves the rolling OHLC
+                self._prev_day_high = high
+                self._prev_day_low = low
+                self._prev_day_close = close
+
+            self._last_candle_timestamp = timestamp_at(end)
+
+    # ========================================================
+    # INTERNAL HELPERS
+    # ========================================================
+    def _start_session(
+        self, candle_ts, candle_ordinal: int, candle_open, candle_high, candle_low, candle_close
+    ):
+        """
+        Open a session at this candle: bootstrap on the first candle ever,
+        otherwise end the active session first (CASE 1 / CASE 3).
+        """
+        candle_date = candle_ts.date()
 
         # CASE 1 — first candle ever (bootstrap)
-        if self._active_session_date is None:
+        if self._active_session_ordinal < 0:
             self._logger.info(f"[SESSION] First session initialized for {candle_date}")
 
             # bootstrap previous-day OHLC from first candle
@@ -72,6 +184,7 @@ class SessionBoundaryDetector:
 
             # set active session
             self._active_session_date = candle_date
+            self._active_session_ordinal = candle_ordinal
             self._active_session_context = SessionContext(
                 session_date=candle_date,
                 session_start_timestamp=candle_ts,
@@ -84,7 +197,7 @@ class SessionBoundaryDetector:
             )
 
             # publish SessionStartEvent for the first session
-            self._event_bus.publish(
+            self._event_bus.publish_event(
                 SessionStartEvent(timestamp=candle_ts, session_context=self._active_session_context)
             )
             self._logger.info(f"[SESSION] Session started: {candle_date}")
@@ -92,27 +205,18 @@ class SessionBoundaryDetector:
             self._last_candle_timestamp = candle_ts
             return
 
-        # CASE 2 — same session (just update rolling OHLC candidate)
-        if candle_date == self._active_session_date:
-            # rolling update for previous-day OHLC candidate
-            # note: prev_day_* were seeded at session start (bootstrap or previous)
-            self._prev_day_high = max(self._prev_day_high, candle_high)
-            self._prev_day_low = min(self._prev_day_low, candle_low)
-            self._prev_day_close = candle_close
-
-            self._last_candle_timestamp = candle_ts
-            return
-
         # CASE 3 — new session detected (date has changed)
         self._logger.info(
             f"[SESSION] Session change detected: {self._active_session_date} → {candle_date}"
         )
 
-        # finalize previous session end timestamp (last seen candle of previous session)
-        self._active_session_context.session_end_timestamp = self._last_candle_timestamp
+        # finalize previous session: new snapshot carrying the last seen candle of that session
+        self._active_session_context = replace(
+            self._active_session_context, session_end_timestamp=self._last_candle_timestamp
+        )
 
         # publish SessionEndEvent with the finalized previous session context
-        self._event_bus.publish(
+        self._event_bus.publish_event(
             SessionEndEvent(timestamp=self._last_candle_timestamp, session_context=self._active_session_context)
         )
         self._logger.info(f"[SESSION] Session ended: {self._active_session_date}")
@@ -125,6 +229,7 @@ class SessionBoundaryDetector:
 
         # start new session context using the current candle as the open of the new session
         self._active_session_date = candle_date
+        self._active_session_ordinal = candle_ordinal
         self._active_session_context = SessionContext(
             session_date=candle_date,
             session_start_timestamp=candle_ts,
@@ -137,7 +242,7 @@ class SessionBoundaryDetector:
         )
 
         # publish SessionStartEvent with the new session context
-        self._event_bus.publish(
+        self._event_bus.publish_event(
             SessionStartEvent(timestamp=candle_ts, session_context=self._active_session_context)
         )
         self._logger.info(f"[SESSION] Session started: {candle_date}")
@@ -11,10 +11,11 @@ from typing import Optional
 # ============================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SessionContext:
     """
     Immutable snapshot of a trading session's contextual data.
+    Finalizing a session produces a new snapshot (dataclasses.replace).
 
     Used for:
     - Session boundary awareness
@@ -3,11 +3,18 @@
 # ============================================================
 
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
 
 from core.event_bus import EventBus
+from core.events.candle_events import CandleClosedEvent, CandleUpdateEvent
 from core.logger import Logger
 
+_ONE_MINUTE = timedelta(minutes=1)
+
+TIMEFRAME_1M = "1m"
+
 # ============================================================
 # CANDLE BUILDER
 # ============================================================
@@ -26,8 +33,25 @@ class CandleBuilder:
         self._event_bus = event_bus
         self._logger = logger
         self._timeframe = timeframe
-        # key: symbol -> current candle
-        self._current_candles: Dict[str, Dict] = {}
+        self._timeframe_label = TIMEFRAME_1M
+        # last minute bucket seen; consecutive ticks mostly share it
+        self._bucket_start: Optional[datetime] = None
+        self._bucket_next: Optional[datetime] = None
+        self._candle_end: Optional[datetime] = None
+        # current candle per symbol, stored column-wise (SoA):
+        # symbol -> slot index into the parallel lists below
+        self._slots: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._start_times: List[datetime] = []
+        self._end_times: List[datetime] = []
+        self._opens: List[float] = []
+        self._highs: List[float] = []
+        self._lows: List[float] = []
+        self._closes: List[float] = []
+        self._volumes: List[int] = []
+
+        # CandleUpdateEvent channel handle for the per-tick update publish
+        self._update_ch = self._event_bus.channel("CandleUpdateEvent")
 
         # Subscribe to TickEvent
         self._event_bus.subscribe("TickEvent", self._on_tick)
@@ -37,74 +61,91 @@ class CandleBuilder:
     # CORE CANDLE LOGIC
     # ========================================================
 
-    def process_tick(self, tick: Dict) -> Dict[str, Optional[Dict]]:
+    def process_tick(self, tick: Dict) -> Tuple[int, Optional[CandleClosedEvent]]:
         """
         Process a single tick and update candle state.
 
         Returns:
-            {
-              "update": current candle (after update),
-              "closed": closed candle (if any, else None)
-            }
+            (slot of the symbol's current candle after the update,
+             closed candle if this tick started a new one, else None)
         """
         symbol = tick["symbol"]
         price = tick["price"]
         volume = tick["volume"]
         timestamp: datetime = tick["timestamp"]
 
-        candle_start = timestamp.replace(second=0, microsecond=0)
-        candle_end = candle_start + self._timeframe
+        bucket_start = self._bucket_start
+        if bucket_start is None or not (bucket_start <= timestamp < self._bucket_next):
+            bucket_start = timestamp.replace(second=0, microsecond=0)
+            self._bucket_start = bucket_start
+            self._bucket_next = bucket_start + _ONE_MINUTE
+            self._candle_end = bucket_start + self._timeframe
+        candle_start = bucket_start
+        candle_end = self._candle_end
 
-        closed_candle = None
-
-        current = self._current_candles.get(symbol)
+        i = self._slots.get(symbol)
 
         # Case 1: No candle yet → start new candle
-        if current is None:
-            current = {
-                "symbol": symbol,
-                "timeframe": "1m",
-                "start_time": candle_start,
-                "end_time": candle_end,
-                "open": price,
-                "high": price,
-                "low": price,
-                "close": price,
-                "volume": volume,
-            }
-            self._current_candles[symbol] = current
-            return {"update": current, "closed": None}
+        if i is None:
+            i = len(self._symbols)
+            self._slots[symbol] = i
+            self._symbols.append(symbol)
+            self._start_times.append(candle_start)
+            self._end_times.append(candle_end)
+            self._opens.append(price)
+            self._highs.append(price)
+            self._lows.append(price)
+            self._closes.append(price)
+            self._volumes.append(volume)
+            return i, None
 
         # Case 2: Tick belongs to current candle
-        if timestamp < current["end_time"]:
-            current["high"] = max(current["high"], price)
-            current["low"] = min(current["low"], price)
-            current["close"] = price
-            current["volume"] += volume
-            return {"update": current, "closed": None}
+        if timestamp < self._end_times[i]:
+            if price > self._highs[i]:
+                self._highs[i] = price
+            elif price < self._lows[i]:
+                self._lows[i] = price
+            self._closes[i] = price
+            self._volumes[i] += volume
+            return i, None
 
         # Case 3: Tick belongs to next candle → close current
-        closed_candle = current
-
-        new_candle = {
-            "symbol": symbol,
-            "timeframe": "1m",
-            "start_time": candle_start,
-            "end_time": candle_end,
-            "open": price,
-            "high": price,
-            "low": price,
-            "close": price,
-            "volume": volume,
-        }
-
-        self._current_candles[symbol] = new_candle
-
+        closed_candle = CandleClosedEvent(
+            symbol=symbol,
+            timeframe=self._timeframe_label,
+            start_time=self._start_times[i],
+            end_time=self._end_times[i],
+            open=self._opens[i],
+            high=self._highs[i],
+            low=self._lows[i],
+            close=self._closes[i],
+            volume=self._volumes[i],
+        )
+
+        self._start_times[i] = candle_start
+        self._end_times[i] = candle_end
+        self._opens[i] = price
+        self._highs[i] = price
+        self._lows[i] = price
+        self._closes[i] = price
+        self._volumes[i] = volume
+
+        return i, closed_candle
+
+    def ohlcv_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Current candles of all symbols as NumPy columns, in first-seen order,
+        for cross-symbol scans (one copy per call).
+        """
         return {
-            "update": new_candle,
-            "closed": closed_candle,
+            "symbol": np.array(self._symbols, dtype=object),
+            "open": np.array(self._opens, dtype=np.float64),
+            "high": np.array(self._highs, dtype=np.float64),
+            "low": np.array(self._lows, dtype=np.float64),
+            "close": np.array(self._closes, dtype=np.float64),
+            "volume": np.array(self._volumes, dtype=np.int64),
         }
-    
+
     # ========================================================
     # EVENT HANDLER
     # ========================================================
@@ -113,27 +154,68 @@ class CandleBuilder:
         """
         Handle incoming TickEvent.
         """
-        result = self.process_tick(tick)
+        i, closed = self.process_tick(tick)
+        symbol = tick["symbol"]
 
         # Emit candle update event
-        update = result["update"]
-        self._event_bus.publish("CandleUpdateEvent", update)
+        self._publish_update(symbol, i)
 
         # Emit candle closed event if present
-        closed = result["closed"]
         if closed:
-            self._event_bus.publish("CandleClosedEvent", closed)
+            self._publish_closed(closed)
+
+    def on_ticks(self, ticks: Iterable[Dict]) -> None:
+        """
+        Fold a batch of ticks without re-entering the bus per tick.
+
+        Closed candles are published as they roll over; CandleUpdateEvent is
+        published once per touched symbol, with its state after the batch.
+        """
+        process_tick = self.process_tick
+        touched: Dict[str, int] = {}
+
+        for tick in ticks:
+            i, closed = process_tick(tick)
+            touched[tick["symbol"]] = i
+            if closed:
+                self._publish_closed(closed)
+
+        for symbol, i in touched.items():
+            self._publish_update(symbol, i)
+
+    # ========================================================
+    # INTERNAL HELPERS
+    # ========================================================
 
+    def _publish_update(self, symbol: str, i: int) -> None:
+        self._event_bus.publish_ch(
+            self._update_ch,
+            CandleUpdateEvent(
+                symbol,
+                self._timeframe_label,
+                self._start_times[i],
+                self._end_times[i],
+                self._opens[i],
+                self._highs[i],
+                self._lows[i],
+                self._closes[i],
+                self._volumes[i],
+            ),
+        )
+
+    def _publish_closed(self, closed: CandleClosedEvent) -> None:
+        self._event_bus.publish_event(closed)
+
+        if self._logger.enabled_for("INFO"):
             self._logger.info(
                 "Candle closed",
-                symbol=closed["symbol"],
-                timeframe=closed["timeframe"],
-                start_time=closed["start_time"],
-                end_time=closed["end_time"],
-                open=closed["open"],
-                high=closed["high"],
-                low=closed["low"],
-                close=closed["close"],
-                volume=closed["volume"],
+                symbol=closed.symbol,
+                timeframe=closed.timeframe,
+                start_time=closed.start_time,
+                end_time=closed.end_time,
+                open=closed.open,
+                high=closed.high,
+                low=closed.low,
+                close=closed.close,
+                volume=closed.volume,
             )
- 
\ No newline at end of file
@@ -3,13 +3,17 @@
 # ============================================================
 
 
-import random
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+
+import numpy as np
 
 from core.event_bus import EventBus
 from core.clock import Clock
-from core.logger import Logger
+from core.logger import Logger, tick_logger
+
+# random draws generated per refill of the price-delta / volume buffers
+RNG_BUFFER_SIZE = 4096
 
 
 # ============================================================
@@ -36,8 +40,19 @@ class FakeTickGenerator:
         self._event_bus = event_bus
         self._clock = clock
         self._logger = logger
+        # per-tick log call, resolved once (no-op when AG_LOG_TICKS=0)
+        self._log_tick = tick_logger(logger)
+
+        # draws are prefilled in blocks and consumed one per tick;
+        # held as Python lists so ticks carry plain float / int values
+        self._rng = np.random.default_rng(seed)
+        self._delta_buf: List[float] = []
+        self._volume_buf: List[int] = []
+        self._buf_idx = 0
+        self._refill()
 
-        self._rng = random.Random(seed)
+        # TickEvent channel handle for the per-tick publish
+        self._tick_ch = event_bus.channel("TickEvent")
   
     # ========================================================
     # TICK EMISSION
@@ -49,25 +64,43 @@ class FakeTickGenerator:
         """
         timestamp = self._clock.now()
 
+        idx = self._buf_idx
+        if idx == RNG_BUFFER_SIZE:
+            self._refill()
+            idx = 0
+        self._buf_idx = idx + 1
+
         # Small random price movement
-        delta = self._rng.uniform(-1.0, 1.0)
-        self._price = max(0.01, self._price + delta)
+        price = self._price + self._delta_buf[idx]
+        if price < 0.01:
+            price = 0.01
+        self._price = price
+
+        symbol = self.symbol
+        rounded = round(price, 2)
+        volume = self._volume_buf[idx]
 
         tick = {
-            "symbol": self.symbol,
-            "price": round(self._price, 2),
-            "volume": self._rng.randint(1, 100),
+            "symbol": symbol,
+            "price": rounded,
+            "volume": volume,
             "timestamp": timestamp,
         }
 
         # Publish event
-        self._event_bus.publish("TickEvent", tick)
+        self._event_bus.publish_ch(self._tick_ch, tick)
 
         # Log event
-        self._logger.info(
-            "Tick emitted",
-            symbol=self.symbol,
-            price=tick["price"],
-            volume=tick["volume"],
-            timestamp=timestamp,
-        )
+        self._log_tick("Tick emitted", symbol, rounded, volume, timestamp)
+
+    # ========================================================
+    # INTERNAL HELPERS
+    # ========================================================
+
+    def _refill(self) -> None:
+        """
+        Draw the next block of price deltas and volumes in two vectorized calls.
+        """
+        self._delta_buf = self._rng.uniform(-1.0, 1.0, size=RNG_BUFFER_SIZE).tolist()
+        self._volume_buf = self._rng.integers(1, 101, size=RNG_BUFFER_SIZE).tolist()
+        self._buf_idx = 0
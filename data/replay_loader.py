@@ -2,11 +2,22 @@
 # IMPORTS
 # ============================================================
 
-from typing import Iterable, Dict
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Dict, List, Optional
+
+import numpy as np
 
 from core.event_bus import EventBus
 from core.clock import ReplayClock
-from core.logger import Logger
+from core.events.candle_events import CandleClosedEvent
+from core.logger import Logger, tick_logger
+
+_ONE_MINUTE = np.timedelta64(1, "m")
+
+# aware timestamps are bucketed on UTC; naive ones on their own wall clock
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
 
 # ============================================================
 # REPLAY LOADER
@@ -15,6 +26,11 @@ from core.logger import Logger
 class ReplayLoader:
     """
     Replays recorded tick data into the EventBus.
+
+    The recording is read into a list once and walked with an index cursor.
+    replay_batch additionally works on NumPy columns (symbol codes, prices,
+    volumes, minutes) built on first use, so a batch is a slice, not a
+    per-batch rebuild from dicts.
     """
 
     def __init__(
@@ -24,10 +40,28 @@ class ReplayLoader:
         clock: ReplayClock,
         logger: Logger,
     ):
-        self._ticks = ticks
+        self._ticks: List[Dict] = list(ticks)
+        self._n = len(self._ticks)
         self._event_bus = event_bus
         self._clock = clock
         self._logger = logger
+        # per-tick log call, resolved once (no-op when AG_LOG_TICKS=0)
+        self._log_tick = tick_logger(logger)
+        # TickEvent channel handle for the per-tick publish
+        self._tick_ch = event_bus.channel("TickEvent")
+
+        # next tick to replay
+        self._i = 0
+        # end of the ticks replay_batch has looked at; [_i, _read) is the
+        # newest, possibly incomplete, minute held back for the next batch
+        self._read = 0
+
+        # replay_batch columns, built on first use
+        self._symbol_names: Optional[np.ndarray] = None
+        self._codes: Optional[np.ndarray] = None
+        self._prices: Optional[np.ndarray] = None
+        self._volumes: Optional[np.ndarray] = None
+        self._minutes: Optional[np.ndarray] = None
 
     # ========================================================
     # REPLAY API
@@ -38,25 +72,159 @@ class ReplayLoader:
         Replay the next tick.
         Returns False when replay is finished.
         """
-        try:
-            tick = next(self._ticks)
-        except StopIteration:
+        i = self._i
+        if i >= self._n:
             self._logger.info("Replay finished")
             return False
 
+        tick = self._ticks[i]
+        self._i = i + 1
+        if self._read < self._i:
+            self._read = self._i
+
         # Drive the clock using recorded timestamp
         self._clock.set(tick["timestamp"])
 
         # Emit the tick event
-        self._event_bus.publish("TickEvent", tick)
+        self._event_bus.publish_ch(self._tick_ch, tick)
 
         # Log replay action
-        self._logger.info(
-            "Tick replayed",
-            symbol=tick["symbol"],
-            price=tick["price"],
-            volume=tick["volume"],
-            timestamp=tick["timestamp"],
+        self._log_tick(
+            "Tick replayed", tick["symbol"], tick["price"], tick["volume"], tick["timestamp"]
         )
 
         return True
+
+    def replay_batch(self, n: int) -> bool:
+        """
+        Replay up to n ticks as 1-minute CandleClosedEvents, skipping
+        per-tick TickEvents (backtest mode). Ticks must be in timestamp order.
+
+        OHLCV is aggregated per (minute, symbol) with NumPy reductions.
+        Ticks of the newest minute are held back until a later batch shows
+        that minute is complete, or the recording runs out.
+        Returns False when replay is finished.
+        """
+        lo = self._i
+        hi = min(self._read + n, self._n)
+        self._read = hi
+        if lo >= hi:
+            self._logger.info("Replay finished")
+            return False
+
+        if self._minutes is None:
+            self._build_columns()
+
+        if hi == self._n:
+            # recording exhausted: every remaining minute is complete
+            end = hi
+        else:
+            minutes = self._minutes
+            end = lo + int(np.searchsorted(minutes[lo:hi], minutes[hi - 1]))
+        self._i = end
+
+        candles = 0
+        if end > lo:
+            candles = self._publish_minute_candles(lo, end)
+            self._clock.set(self._ticks[end - 1]["timestamp"])
+
+        self._logger.info_kv("Batch replayed", "ticks", end - lo, "candles", candles)
+        return True
+
+    # ========================================================
+    # INTERNAL HELPERS
+    # ========================================================
+
+    def _build_columns(self) -> None:
+        """
+        Split the recording into per-field NumPy columns, once.
+        """
+        ticks = self._ticks
+        n = self._n
+        self._symbol_names, self._codes = np.unique(
+            [tick["symbol"] for tick in ticks], return_inverse=True
+        )
+        self._prices = np.fromiter((tick["price"] for tick in ticks), dtype=np.float64, count=n)
+        # float64, like the streaming builder's running sum of tick volumes
+        self._volumes = np.fromiter((tick["volume"] for tick in ticks), dtype=np.float64, count=n)
+
+        # microseconds since the epoch as int64: numpy would silently drop the
+        # tz of aware datetimes (and warn per tick), so they are taken to UTC here
+        # and candle times are rebuilt in each tick's own tz on publish
+        self._aware = ticks[0]["timestamp"].tzinfo is not None
+        epoch = _EPOCH_UTC if self._aware else _EPOCH_NAIVE
+        try:
+            micros = np.fromiter(
+                ((tick["timestamp"] - epoch) // _ONE_MICROSECOND for tick in ticks),
+                dtype=np.int64, count=n,
+            )
+        except TypeError:
+            raise ValueError("replay_batch needs all-naive or all-aware tick timestamps") from None
+        self._minutes = micros.view("datetime64[us]").astype("datetime64[m]")
+
+    def _publish_minute_candles(self, lo: int, hi: int) -> int:
+        """
+        Fold ticks [lo, hi) into one candle per (minute, symbol) and publish
+        them in minute order, then symbol order. Returns the number of candles.
+        """
+        minutes = self._minutes[lo:hi]
+        codes = self._codes[lo:hi]
+
+        # lexsort is stable, so ticks keep arrival order inside each group
+        order = np.lexsort((codes, minutes))
+        minutes = minutes[order]
+        codes = codes[order]
+        prices = self._prices[lo:hi][order]
+        volumes = self._volumes[lo:hi][order]
+
+        count = hi - lo
+        boundary = np.empty(count, dtype=bool)
+        boundary[0] = True
+        boundary[1:] = (minutes[1:] != minutes[:-1]) | (codes[1:] != codes[:-1])
+        starts = np.flatnonzero(boundary)
+        lasts = np.append(starts[1:], count) - 1
+
+        bucket = minutes[starts]
+        start_times = bucket.astype("datetime64[us]").tolist()
+        end_times = (bucket + _ONE_MINUTE).astype("datetime64[us]").tolist()
+        if self._aware:
+            # UTC wall clock -> the tz of the candle's first tick
+            ticks = self._ticks
+            first = (order[starts] + lo).tolist()
+            start_times = [
+                t.replace(tzinfo=timezone.utc).astimezone(ticks[i]["timestamp"].tzinfo)
+                for t, i in zip(start_times, first)
+            ]
+            end_times = [
+                t.replace(tzinfo=timezone.utc).astimezone(ticks[i]["timestamp"].tzinfo)
+                for t, i in zip(end_times, first)
+            ]
+
+        rows = zip(
+            self._symbol_names[codes[starts]].tolist(),
+            start_times,
+            end_times,
+            prices[starts].tolist(),
+            np.maximum.reduceat(prices, starts).tolist(),
+            np.minimum.reduceat(prices, starts).tolist(),
+            prices[lasts].tolist(),
+            np.add.reduceat(volumes, starts).tolist(),
+        )
+
+        publish = self._event_bus.publish_event
+        for symbol, start_time, end_time, open_, high, low, close, volume in rows:
+            publish(
+                CandleClosedEvent(
+                    symbol=symbol,
+                    timeframe="1m",
+                    start_time=start_time,
+                    end_time=end_time,
+                    open=open_,
+                    high=high,
+                    low=low,
+                    close=close,
+                    volume=volume,
+                )
+            )
+
+        return len(starts)
@@ -2,22 +2,19 @@
 # IMPORTS
 # ============================================================
 
+import time
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Optional
 
 from strategy.intent_events import IntentEvent, TriggerSpec, Side
 from core.derived_data.models import GapSnapshotEvent
 from core.derived_data.derived_data_store import DerivedDataStore
-
-# OrderFillEvent may live in core.events.order_events (if present).
-# Handler below is defensive: if import fails, we still run (no fill-handling).
-try:
-    from core.events.order_events import OrderFillEvent
-except Exception:
-    OrderFillEvent = None  # type: ignore
-
+from core.events.order_events import OrderFillEvent
 from core.events.session_events import SessionEndEvent
 
+# intents built within this window share one created_at timestamp
+_NOW_REUSE_NS = 1_000_000
+
 
 # ============================================================
 # DUMMY STRATEGY (Pattern B) - Intent-per-step, event-driven
@@ -64,6 +61,11 @@ class DummyStrategy:
         self._active_symbol: Optional[str] = None
         self._step_index: int = initial_step
         self._active_intent_id: Optional[str] = None
+        # per-instance intent sequence; makes intent ids unique without a clock read
+        self._intent_seq: int = 0
+        # last wall-clock read and the monotonic time it was taken at
+        self._last_now: Optional[datetime] = None
+        self._last_now_mono_ns: int = 0
         self._active: bool = True
         self._auto_advance = auto_advance
         self._flip_timeout_seconds = flip_timeout_seconds
@@ -71,10 +73,10 @@ class DummyStrategy:
         # Subscribe to events
         self._bus.subscribe(GapSnapshotEvent, self._on_gap_snapshot)
 
-        # Always subscribe to a catch-all so tests that publish plain objects (DummyFill)
-        # are handled. The handler will inspect the event shape and ignore unrelated events.
-        # This avoids a hard dependency on core.events.order_events during early checkpoints.
-        self._bus.subscribe(object, self._on_order_fill)
+        # Fills only: the bus dispatches along the MRO, so a catch-all (object)
+        # subscription would also see intent lifecycle events (Approved /
+        # Rejected / Expired), whose .intent.intent_id matches the active intent.
+        self._bus.subscribe(OrderFillEvent, self._on_order_fill)
 
         self._bus.subscribe(SessionEndEvent, self._on_session_end)
 
@@ -85,8 +87,18 @@ class DummyStrategy:
     # ========================================================
 
     def _make_intent_id(self, symbol: str, step_index: int) -> str:
-        ts = datetime.now(timezone.utc).isoformat()
-        return f"{self._id}:{symbol}:step{step_index}:{ts}"
+        self._intent_seq += 1
+        return f"{self._id}:{symbol}:step{step_index}:{self._intent_seq}"
+
+    def _utc_now(self) -> datetime:
+        """
+        UTC wall-clock time, re-read at most once per millisecond.
+        """
+        mono_ns = time.monotonic_ns()
+        if self._last_now is None or mono_ns - self._last_now_mono_ns >= _NOW_REUSE_NS:
+            self._last_now = datetime.now(timezone.utc)
+            self._last_now_mono_ns = mono_ns
+        return self._last_now
 
     def _build_intent(self, symbol: str, step_index: int) -> IntentEvent:
         """
@@ -103,7 +115,7 @@ class DummyStrategy:
             symbol=symbol,
             triggers=triggers,
             auto_advance=self._auto_advance,
-            created_at=datetime.now(timezone.utc),
+            created_at=self._utc_now(),
             correlation_id=None,
             session_date=None,
         )
@@ -111,7 +123,7 @@ class DummyStrategy:
 
     def _publish_intent(self, intent: IntentEvent) -> None:
         # Publish raw IntentEvent (RiskManager is expected to pick it up, approve, etc.)
-        self._bus.publish(intent)
+        self._bus.publish_event(intent)
         self._active_intent_id = intent.intent_id
         self._log.info("[STRATEGY] Intent emitted", intent_id=intent.intent_id, symbol=intent.symbol, step_index=intent.triggers[0].step_index)
 
@@ -135,8 +147,7 @@ class DummyStrategy:
 
         # pick symbol with smallest absolute gap
         try:
-            sorted_syms = sorted(event.gaps.items(), key=lambda kv: kv[1].get("gap_pct_abs", float("inf")))
-            chosen_symbol = sorted_syms[0][0]
+            chosen_symbol = min(event.gaps.items(), key=lambda kv: kv[1].get("gap_pct_abs", float("inf")))[0]
         except Exception as e:
             self._log.info("[STRATEGY] Error selecting symbol from gap snapshot", error=str(e))
             return
@@ -148,36 +159,20 @@ class DummyStrategy:
         intent = self._build_intent(chosen_symbol, self._step_index)
         self._publish_intent(intent)
 
-    def _on_order_fill(self, event: Any) -> None:
+    def _on_order_fill(self, event: OrderFillEvent) -> None:
         """
-        Handle OrderFillEvent-like objects.
-
-        This handler is intentionally registered as a catch-all (object). It inspects
-        the incoming event and proceeds only if the event *looks like* a fill:
-         - has attribute 'intent_id' OR
-         - has attribute 'origin_intent_id' OR
-         - has attribute 'intent' which contains 'intent_id'
-
-        This makes the strategy robust in tests where a plain object is used to simulate fills,
-        and it avoids a hard import dependency on a concrete OrderFillEvent dataclass.
+        Handle OrderFillEvent (subscribed by class, so subclasses count too).
+        Advances only when the fill belongs to the active intent.
         """
         if not self._active or not self._active_intent_id:
             return
 
-        # extract intent id robustly
-        intent_id = None
-        if hasattr(event, "intent_id"):
-            intent_id = getattr(event, "intent_id")
-        elif hasattr(event, "origin_intent_id"):
-            intent_id = getattr(event, "origin_intent_id")
-        elif hasattr(event, "intent") and getattr(event, "intent") is not None:
-            nested = getattr(event, "intent")
-            intent_id = getattr(nested, "intent_id", None)
-        else:
-            # not a fill-like object
+        # only a fill's own intent_id counts; never look through event.intent,
+        # which is how lifecycle events (Approved / Rejected / Expired) carry it
+        if not isinstance(event, OrderFillEvent):
             return
 
-        if intent_id != self._active_intent_id:
+        if event.intent_id != self._active_intent_id:
             # not related to our current active intent
             return
 
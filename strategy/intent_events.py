@@ -18,7 +18,7 @@ class Side(Enum):
     SHORT = "SHORT"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerSpec:
     """
     A single conditional trigger inside an Intent.
@@ -38,7 +38,7 @@ class TriggerSpec:
     meta: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IntentEvent:
     """
     Strategy -> Risk -> Execution intention.
@@ -66,21 +66,21 @@ class IntentEvent:
 # APPROVAL / LIFECYCLE EVENTS
 # ============================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ApprovedIntentEvent:
     intent: IntentEvent
     approved_by: str
     approved_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RejectedIntentEvent:
     intent: IntentEvent
     reason: str
     rejected_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IntentExpiredEvent:
     intent: IntentEvent
     reason: Optional[str]
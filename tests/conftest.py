@@ -3,7 +3,11 @@
 # ============================================================
 
 import pytest
-from typing import Callable, Dict, List, Any
+from collections import deque
+from typing import Callable, Dict, Tuple
+
+from core.events.session_events import SessionStartEvent
+from core.session.session_context import SessionContext
 
 # ============================================================
 # TEST EVENT BUS & LOGGER (TEST HELPERS)
@@ -16,55 +20,148 @@ class TestEventBus:
     - publish(event): event is an event instance; dispatches to matching subscribers
     """
     def __init__(self):
-        self._subs: Dict[Any, List[Callable]] = {}
+        # frozen handler tuples, split by key kind so dispatch never has to
+        # guess what a key is
+        self._subs_by_type: Dict[type, Tuple[Callable, ...]] = {}
+        self._subs_by_name: Dict[str, Tuple[Callable, ...]] = {}
+        # event class -> matching handlers, filled on first publish, cleared on subscribe
+        self._resolved: Dict[type, Tuple[Callable, ...]] = {}
 
     def subscribe(self, key, handler: Callable):
-        self._subs.setdefault(key, []).append(handler)
+        if isinstance(key, type):
+            table = self._subs_by_type
+        elif isinstance(key, str):
+            table = self._subs_by_name
+        else:
+            raise TypeError(f"subscription key must be an event class or name, got {key!r}")
+
+        table[key] = table.get(key, ()) + (handler,)
+        self._resolved.clear()
+
+    def unsubscribe(self, key, handler: Callable):
+        """
+        Remove one registration of a handler; unknown handlers are ignored.
+        """
+        table = self._subs_by_type if isinstance(key, type) else self._subs_by_name
+        handlers = table.get(key, ())
+        if handler not in handlers:
+            return
+
+        i = handlers.index(handler)
+        remaining = handlers[:i] + handlers[i + 1:]
+        if remaining:
+            table[key] = remaining
+        else:
+            del table[key]
+        self._resolved.clear()
+
+    def reset(self):
+        """
+        Drop every subscription, clearing the tables in place.
+        """
+        self._subs_by_type.clear()
+        self._subs_by_name.clear()
+        self._resolved.clear()
 
     def publish(self, event):
         """
         Dispatch event to handlers subscribed by:
         - the event class (exact type)
+        - any of the event class's base classes (isinstance)
         - the event class's __name__ (string)
-        - any subscribers who passed the event class's base classes (isinstance)
         """
         # If a string was published (rare), dispatch to string-keyed handlers
         if isinstance(event, str):
-            for h in self._subs.get(event, []):
-                h(None)
+            self.publish_topic(event, None)
             return
 
+        self.publish_event(event)
+
+    def publish_topic(self, topic: str, payload):
+        for h in self._subs_by_name.get(topic, ()):
+            h(payload)
+
+    def publish_many(self, topic: str, payloads):
+        handlers = self._subs_by_name.get(topic, ())
+        for payload in payloads:
+            for h in handlers:
+                h(payload)
+
+    def channel(self, topic: str) -> str:
+        # the topic name doubles as its channel handle here
+        return topic
+
+    def publish_ch(self, ch: str, payload):
+        self.publish_topic(ch, payload)
+
+    def publish_event(self, event):
         ev_cls = event.__class__
-        ev_name = ev_cls.__name__
+        handlers = self._resolved.get(ev_cls)
+        if handlers is None:
+            handlers = self._resolve(ev_cls)
+
+        for h in handlers:
+            h(event)
+
+    def _resolve(self, ev_cls: type) -> Tuple[Callable, ...]:
+        """
+        Collect handlers along the MRO (most specific class first), then
+        the class-name subscribers, once per event class.
+        """
+        by_type = self._subs_by_type
+        handlers: Tuple[Callable, ...] = ()
+        for base in ev_cls.__mro__:
+            handlers += by_type.get(base, ())
+        handlers += self._subs_by_name.get(ev_cls.__name__, ())
+
+        self._resolved[ev_cls] = handlers
+        return handlers
 
-        # dispatch to handlers subscribed by exact class or by class name
-        for key, handlers in list(self._subs.items()):
-            try:
-                if key is ev_cls or key == ev_name or (isinstance(key, type) and issubclass(ev_cls, key)):
-                    for h in handlers:
-                        h(event)
-            except Exception:
-                # defensive: if key is not a type or comparable, ignore
-                continue
+
+def _noop(*args, **kwargs):
+    pass
 
 
 class TestLogger:
     """
     Simple test logger capturing messages for assertions / debug.
     Methods: info(msg, **kwargs), debug(msg), error(msg)
+
+    Records are only kept with capture=True; otherwise every log method is a
+    no-op bound at init, so tests that never read .records pay nothing per call.
     """
-    def __init__(self):
-        self.records = []
+    # bounded so long tick replays cannot grow memory without limit
+    MAX_RECORDS = 4096
+
+    def __init__(self, capture: bool = False):
+        self.capture = capture
+        self.records = deque(maxlen=self.MAX_RECORDS)
+        if not capture:
+            self.info = self.info_kv = self.debug = self.error = self.log_tick = _noop
 
     def info(self, msg, **kwargs):
         self.records.append(("INFO", msg, kwargs))
 
+    def info_kv(self, msg, key1=None, val1=None, key2=None, val2=None):
+        kwargs = {}
+        if key1 is not None:
+            kwargs[key1] = val1
+        if key2 is not None:
+            kwargs[key2] = val2
+        self.records.append(("INFO", msg, kwargs))
+
     def debug(self, msg, **kwargs):
         self.records.append(("DEBUG", msg, kwargs))
 
     def error(self, msg, **kwargs):
         self.records.append(("ERROR", msg, kwargs))
 
+    def log_tick(self, msg, symbol, price, volume, timestamp):
+        self.records.append(("INFO", msg, (symbol, price, volume, timestamp)))
+
+    def enabled_for(self, level: str) -> bool:
+        return True
+
 
 # ============================================================
 # PYTEST FIXTURES
@@ -84,16 +181,43 @@ def logger():
     """
     return TestLogger()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def event_bus_factory():
     """
-    Factory that returns a fresh EventBus (for deterministic isolation tests).
+    Factory for deterministic isolation tests: every call returns the
+    module's one EventBus with all subscriptions cleared, so no state from
+    an earlier call (or test) can leak in.
     """
-    return lambda: TestEventBus()
+    bus = TestEventBus()
+
+    def make():
+        bus.reset()
+        return bus
+    return make
 
 @pytest.fixture
 def logger_factory():
     """
-    Factory that returns a fresh TestLogger.
+    Factory that returns a fresh TestLogger; pass capture=True to keep records.
+    """
+    return lambda capture=False: TestLogger(capture=capture)
+
+@pytest.fixture
+def session_start_event():
+    """
+    Factory for a SessionStartEvent at `now` with only today_open set
+    (no prev-day fields), as the derived-data gap tests need.
     """
-    return lambda: TestLogger()
+    def _make(now, today_open):
+        session_ctx = SessionContext(
+            session_date=now.date(),
+            session_start_timestamp=now,
+            session_end_timestamp=None,
+            today_open=today_open,
+            prev_day_open=None,
+            prev_day_high=None,
+            prev_day_low=None,
+            prev_day_close=None,
+        )
+        return SessionStartEvent(timestamp=now, session_context=session_ctx)
+    return _make
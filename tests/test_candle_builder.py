@@ -1,10 +1,17 @@
 from datetime import datetime, timedelta
 
+import pytest
+
 from core.event_bus import EventBus
+from core.events.candle_events import CandleClosedEvent
 from core.logger import Logger
 from data.candle_builder import CandleBuilder
 
 
+def _tick(symbol, price, volume, timestamp):
+    return {"symbol": symbol, "price": price, "volume": volume, "timestamp": timestamp}
+
+
 def test_candle_builder_basic_flow():
     bus = EventBus()
     logger = Logger("test_candle_builder")
@@ -13,13 +20,13 @@ def test_candle_builder_basic_flow():
     closed = []
 
     def on_update(candle):
-        updates.append(candle.copy())
+        updates.append(candle)
 
     def on_closed(candle):
-        closed.append(candle.copy())
+        closed.append(candle)
 
     bus.subscribe("CandleUpdateEvent", on_update)
-    bus.subscribe("CandleClosedEvent", on_closed)
+    bus.subscribe(CandleClosedEvent, on_closed)
 
     builder = CandleBuilder(
         event_bus=bus,
@@ -27,37 +34,31 @@ def test_candle_builder_basic_flow():
         timeframe=timedelta(minutes=1),
     )
 
-    # Tick 1 — opens candle
-    bus.publish(
-        "TickEvent",
-        {
-            "symbol": "TEST",
-            "price": 100.0,
-            "volume": 10,
-            "timestamp": datetime(2024, 1, 1, 9, 15, 10),
-        },
-    )
-
-    # Tick 2 — same minute
-    bus.publish(
-        "TickEvent",
-        {
-            "symbol": "TEST",
-            "price": 102.0,
-            "volume": 5,
-            "timestamp": datetime(2024, 1, 1, 9, 15, 40),
-        },
-    )
-
-    # Tick 3 — next minute → closes previous candle
-    bus.publish(
+    bus.publish_many(
         "TickEvent",
-        {
-            "symbol": "TEST",
-            "price": 101.0,
-            "volume": 7,
-            "timestamp": datetime(2024, 1, 1, 9, 16, 1),
-        },
+        [
+            # Tick 1 — opens candle
+            {
+                "symbol": "TEST",
+                "price": 100.0,
+                "volume": 10,
+                "timestamp": datetime(2024, 1, 1, 9, 15, 10),
+            },
+            # Tick 2 — same minute
+            {
+                "symbol": "TEST",
+                "price": 102.0,
+                "volume": 5,
+                "timestamp": datetime(2024, 1, 1, 9, 15, 40),
+            },
+            # Tick 3 — next minute → closes previous candle
+            {
+                "symbol": "TEST",
+                "price": 101.0,
+                "volume": 7,
+                "timestamp": datetime(2024, 1, 1, 9, 16, 1),
+            },
+        ],
     )
 
     # Assertions
@@ -66,11 +67,87 @@ def test_candle_builder_basic_flow():
 
     closed_candle = closed[0]
 
-    assert closed_candle["open"] == 100.0
-    assert closed_candle["high"] == 102.0
-    assert closed_candle["low"] == 100.0
-    assert closed_candle["close"] == 102.0
-    assert closed_candle["volume"] == 15
+    assert closed_candle.open == 100.0
+    assert closed_candle.high == 102.0
+    assert closed_candle.low == 100.0
+    assert closed_candle.close == 102.0
+    assert closed_candle.volume == 15
+
+    assert closed_candle.start_time == datetime(2024, 1, 1, 9, 15)
+    assert closed_candle.end_time == datetime(2024, 1, 1, 9, 16)
+
+
+def test_process_tick_updates_candle_columns_in_place():
+    builder = CandleBuilder(event_bus=EventBus(), logger=Logger("test_candle_builder"))
+
+    ticks = [
+        ("AAA", 100.0, 10, datetime(2024, 1, 1, 9, 15, 10)),
+        ("BBB", 50.0, 2, datetime(2024, 1, 1, 9, 15, 12)),
+        ("AAA", 99.0, 3, datetime(2024, 1, 1, 9, 15, 20)),
+    ]
+    slots = [
+        builder.process_tick({"symbol": s, "price": p, "volume": v, "timestamp": t})
+        for s, p, v, t in ticks
+    ]
+
+    assert slots == [(0, None), (1, None), (0, None)]
+
+    columns = builder.ohlcv_columns()
+    assert columns["symbol"].tolist() == ["AAA", "BBB"]
+    assert columns["high"].tolist() == [100.0, 50.0]
+    assert columns["low"].tolist() == [99.0, 50.0]
+    assert columns["close"].tolist() == [99.0, 50.0]
+    assert columns["volume"].tolist() == [13, 2]
+
+
+def test_process_tick_recomputes_bucket_when_time_moves_backwards():
+    bus = EventBus()
+    updates = []
+    bus.subscribe("CandleUpdateEvent", updates.append)
+    CandleBuilder(event_bus=bus, logger=Logger("test_candle_builder"))
+
+    bus.publish("TickEvent", _tick("AAA", 1.0, 1, datetime(2024, 1, 1, 9, 16, 5)))
+    bus.publish("TickEvent", _tick("BBB", 2.0, 1, datetime(2024, 1, 1, 9, 15, 59)))
+
+    assert updates[-1].start_time == datetime(2024, 1, 1, 9, 15)
+    assert updates[-1].end_time == datetime(2024, 1, 1, 9, 16)
+
+
+def test_candle_updates_are_immutable_snapshots():
+    bus = EventBus()
+    payloads = []
+    bus.subscribe("CandleUpdateEvent", payloads.append)
+    CandleBuilder(event_bus=bus, logger=Logger("test_candle_builder"))
+
+    for second, price in ((10, 100.0), (20, 101.0)):
+        bus.publish("TickEvent", _tick("TEST", price, 1, datetime(2024, 1, 1, 9, 15, second)))
+
+    # earlier snapshot is untouched by the later tick
+    assert (payloads[0].close, payloads[0].volume) == (100.0, 1)
+    assert (payloads[1].close, payloads[1].volume) == (101.0, 2)
+    with pytest.raises(AttributeError):
+        payloads[1].close = 0.0
+
+
+def test_on_ticks_publishes_closes_inline_and_one_update_per_symbol():
+    bus = EventBus()
+    updates = []
+    closed = []
+    bus.subscribe("CandleUpdateEvent", updates.append)
+    bus.subscribe(CandleClosedEvent, closed.append)
+    builder = CandleBuilder(event_bus=bus, logger=Logger("test_candle_builder"))
+
+    builder.on_ticks(
+        [
+            _tick("AAA", 100.0, 10, datetime(2024, 1, 1, 9, 15, 10)),
+            _tick("BBB", 50.0, 1, datetime(2024, 1, 1, 9, 15, 20)),
+            _tick("AAA", 102.0, 5, datetime(2024, 1, 1, 9, 15, 40)),
+            _tick("AAA", 101.0, 7, datetime(2024, 1, 1, 9, 16, 1)),
+        ]
+    )
 
-    assert closed_candle["start_time"] == datetime(2024, 1, 1, 9, 15)
-    assert closed_candle["end_time"] == datetime(2024, 1, 1, 9, 16)
+    assert [(c.symbol, c.high, c.volume) for c in closed] == [("AAA", 102.0, 15)]
+    assert [(u.symbol, u.close, u.volume) for u in updates] == [
+        ("AAA", 101.0, 7),
+        ("BBB", 50.0, 1),
+    ]
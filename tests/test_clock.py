@@ -34,3 +34,31 @@ def test_replay_clock_advance_time():
     clock.advance(timedelta(minutes=5))
 
     assert clock.now() == datetime(2024, 1, 1, 9, 20)
+
+
+def test_replay_clock_ns_round_trip():
+    start_time = datetime(2024, 1, 1, 9, 15)
+    clock = ReplayClock(start_time)
+
+    start_ns = clock.now_ns()
+    clock.advance_ns(90 * 1_000_000_000)
+    assert clock.now() == datetime(2024, 1, 1, 9, 16, 30)
+
+    clock.set_ns(start_ns)
+    assert clock.now() == start_time
+
+    clock.set(datetime(2024, 1, 1, 9, 30))
+    assert clock.now_ns() == start_ns + 15 * 60 * 1_000_000_000
+
+
+def test_replay_clock_ns_keeps_timezone():
+    from datetime import timezone
+
+    ist = timezone(timedelta(hours=5, minutes=30))
+    start_time = datetime(2024, 1, 1, 9, 15, tzinfo=ist)
+    clock = ReplayClock(start_time)
+
+    clock.advance_ns(60 * 1_000_000_000)
+
+    assert clock.now() == datetime(2024, 1, 1, 9, 16, tzinfo=ist)
+    assert clock.now().tzinfo == ist
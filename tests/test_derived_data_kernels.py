@@ -0,0 +1,56 @@
+import numpy as np
+
+from core.derived_data import kernels
+
+
+def _outputs(n, k_target, k_flip):
+    return (
+        np.empty(n), np.empty(n), np.empty(n), np.empty(n),
+        np.empty((n, k_target)), np.empty((n, k_target)),
+        np.empty((n, k_flip)), np.empty((n, k_flip)),
+    )
+
+
+def test_compute_all_matches_scalar_formulas():
+    H = np.array([110.0, 150.0])
+    L = np.array([90.0, 50.0])
+    C = np.array([100.0, 120.0])
+    ks_target = np.arange(3) * 0.0025
+    ks_flip = np.array([0.0, 0.02]) / 100.0
+
+    P, BC, TC, width, tgt_pos, tgt_neg, flip_pos, flip_neg = out = _outputs(2, 3, 2)
+    kernels.compute_all(
+        H, L, C,
+        *kernels.step_multipliers(ks_target), *kernels.step_multipliers(ks_flip),
+        *out,
+    )
+
+    p = (150.0 + 50.0 + 120.0) / 3.0
+    bc = (150.0 + 50.0) / 2.0
+    tc = 2 * p - bc
+    assert P[1] == p
+    assert BC[1] == bc
+    assert TC[1] == tc
+    assert width[1] == abs(tc - bc) / p * 100.0
+
+    assert tgt_pos[0].tolist() == [100.0 * (1 + k) for k in ks_target.tolist()]
+    assert tgt_neg[1].tolist() == [120.0 * (1 - k) for k in ks_target.tolist()]
+    assert flip_pos[0].tolist() == [100.0 * (1 + k) for k in ks_flip.tolist()]
+    assert flip_neg[1].tolist() == [120.0 * (1 - k) for k in ks_flip.tolist()]
+
+
+def test_compute_all_loop_matches_numpy_reference():
+    rng = np.random.default_rng(7)
+    H, L, C = rng.uniform(50.0, 150.0, size=(3, 64))
+    ks_target = np.arange(81) * 0.0025
+    ks_flip = np.array([0.0, 0.02, 0.04, 0.05, 0.06, 0.08, 0.10]) / 100.0
+
+    got = _outputs(64, 81, 7)
+    expected = _outputs(64, 81, 7)
+    multipliers = (*kernels.step_multipliers(ks_target), *kernels.step_multipliers(ks_flip))
+    # the loop body Numba compiles; plain Python (prange = range) without Numba
+    kernels._compute_all_loop(H, L, C, *multipliers, *got)
+    kernels._compute_all_numpy(H, L, C, *multipliers, *expected)
+
+    for g, e in zip(got, expected):
+        assert np.array_equal(g, e)
@@ -1,12 +1,17 @@
+import numpy as np
 import pytest
-from datetime import datetime, timezone, date, timedelta
+from collections import deque
+from datetime import datetime, timezone
+from types import MappingProxyType
 
 # imports from your project
 from core.derived_data.derived_data_store import InMemoryDerivedDataStore
 from core.derived_data.derived_data_processor import DerivedDataProcessor
 from core.derived_data import config as derived_config
-from core.events.session_events import SessionStartEvent
-from core.session.session_context import SessionContext
+
+
+# fixed wall-clock stand-in; no test asserts on real time
+_NOW = datetime(2026, 1, 10, 9, 15, tzinfo=timezone.utc)
 
 
 # ============================================================
@@ -17,82 +22,118 @@ class _TestEventBus:
     def __init__(self):
         # key: event class -> list of handlers
         self._subs = {}
+        # concrete event class -> matching handlers; dropped on subscribe
+        self._resolved = {}
 
     def subscribe(self, event_key, handler):
         handlers = self._subs.setdefault(event_key, [])
         handlers.append(handler)
+        self._resolved.clear()
 
     def publish(self, event):
-        # dispatch to any subscriber whose key is class and event is instance of key
-        for key, handlers in list(self._subs.items()):
-            try:
-                if isinstance(event, key):
-                    for h in handlers:
-                        h(event)
-            except Exception:
-                # key might be string-based; also allow exact match on type equality
-                if key == type(event):
-                    for h in handlers:
-                        h(event)
+        # handlers of the event's class and its base classes, resolved once per class
+        ev_cls = type(event)
+        handlers = self._resolved.get(ev_cls)
+        if handlers is None:
+            handlers = [h for cls in ev_cls.__mro__ for h in self._subs.get(cls, ())]
+            self._resolved[ev_cls] = handlers
+        for h in handlers:
+            h(event)
+
+
+def _noop(*args, **kwargs):
+    pass
 
 
 class _TestLogger:
-    def __init__(self):
-        self.records = []
+    def __init__(self, capture=False):
+        # bounded ring; nothing is stored (or even appended) unless capture=True
+        self.records = deque(maxlen=4096)
+        if not capture:
+            self.info = _noop
+
+    def reset(self):
+        self.records.clear()
 
     def info(self, *args, **kwargs):
-        # store tuples for assertions if needed
-        self.records.append((args, kwargs))
+        # store args only; keep kwargs alongside when there are any
+        self.records.append((args, kwargs) if kwargs else (args,))
 
 
 # ============================================================
 # Fixtures
 # ============================================================
+# bus / logger / store / processor are built once per module and reset
+# before every test; tests that need a processor of their own wire it to a
+# fresh _TestEventBus so the shared bus only ever carries the shared processor.
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def event_bus():
     return _TestEventBus()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def logger():
-    return _TestLogger()
+    # tests below assert on "[DERIVED] ..." messages
+    return _TestLogger(capture=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def store():
     return InMemoryDerivedDataStore()
 
 
 @pytest.fixture
+def universe(monkeypatch):
+    """
+    Set config.symbol_universe / manually_omitted_symbols for one test;
+    monkeypatch restores both afterwards.
+    """
+    def _set(symbols, omitted=None):
+        monkeypatch.setattr(derived_config, "symbol_universe", list(symbols))
+        monkeypatch.setattr(derived_config, "manually_omitted_symbols", omitted)
+    return _set
+
+
+@pytest.fixture(scope="module")
 def processor(event_bus, logger, store):
     # create processor with test bus/logger/store
     return DerivedDataProcessor(event_bus=event_bus, logger=logger, store=store)
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared(processor, logger, store):
+    store.reset()
+    logger.reset()
+    # undo per-test refresh_config overrides
+    processor.refresh_config()
+    # drop memoized universe and pre-market results so no test inherits a cache hit
+    processor._pre_market_cache.clear()
+    processor._universe_source = None
+    processor._omitted_source = None
+    processor._columns = None
+
+
 # ============================================================
 # Helper: sample prev_day_ohlc
 # ============================================================
 
-def prev_day_ohlc_sample():
-    """
-    Construct prev-day OHLC that yields:
-    - AAA: narrow CPR width (should be first)
-    - BBB: wider CPR width (should be second)
-    - CCC: missing
-    """
-    return {
-        "AAA": {"high": 110.0, "low": 90.0, "close": 100.0},   # narrow (width ~0)
-        "BBB": {"high": 150.0, "low": 50.0, "close": 120.0},   # wide CPR
-        # "CCC" intentionally missing
-    }
+# Read-only module constant (the processor never mutates its input):
+# - AAA: narrow CPR width (should be first)
+# - BBB: wider CPR width (should be second)
+# - CCC: missing
+_PREV_DAY_OHLC = MappingProxyType({
+    "AAA": MappingProxyType({"high": 110.0, "low": 90.0, "close": 100.0}),   # narrow (width ~0)
+    "BBB": MappingProxyType({"high": 150.0, "low": 50.0, "close": 120.0}),   # wide CPR
+    # "CCC" intentionally missing
+})
 
 
 # ============================================================
 # TESTS
 # ============================================================
 
-def test_pre_market_builds_filtered_and_tradable(processor, store, event_bus, logger):
+def test_pre_market_builds_filtered_and_tradable(processor, store, event_bus, logger, universe):
     """
     Verifies:
     - symbols_missing_prev_day_ohlc is tracked
@@ -102,10 +143,9 @@ def test_pre_market_builds_filtered_and_tradable(processor, store, event_bus, lo
     """
 
     # Override universe for this test
-    derived_config.symbol_universe[:] = ["AAA", "BBB", "CCC"]
-    derived_config.manually_omitted_symbols = None
+    universe(["AAA", "BBB", "CCC"])
 
-    processor.run_pre_market(prev_day_ohlc_sample())
+    processor.run_pre_market(_PREV_DAY_OHLC)
 
     # snapshot persisted
     assert len(store.universe_snapshots) == 1
@@ -138,51 +178,171 @@ def test_pre_market_builds_filtered_and_tradable(processor, store, event_bus, lo
     assert sl is not None
 
 
-def test_pre_market_is_deterministic(processor, store):
+def test_pre_market_is_deterministic(processor, store, universe):
     """
     Running pre-market twice yields stable snapshots (same order)
     """
-    derived_config.symbol_universe[:] = ["AAA", "BBB", "CCC"]
-    derived_config.manually_omitted_symbols = None
+    universe(["AAA", "BBB", "CCC"])
 
-    processor.run_pre_market(prev_day_ohlc_sample())
+    processor.run_pre_market(_PREV_DAY_OHLC)
     first = store.universe_snapshots[-1]
 
     # run again with same input
-    processor.run_pre_market(prev_day_ohlc_sample())
+    processor.run_pre_market(_PREV_DAY_OHLC)
     second = store.universe_snapshots[-1]
 
     assert first.tradable_symbols == second.tradable_symbols
     assert first.filtered_symbols == second.filtered_symbols
+    assert first.symbols_missing_prev_day_ohlc == second.symbols_missing_prev_day_ohlc == ["CCC"]
+
+
+def test_pre_market_reuses_cached_records_for_identical_input(processor, store, universe):
+    """
+    Identical prev-day input is served from the cache (same record objects);
+    changed input is recomputed.
+    """
+    universe(["AAA", "BBB", "CCC"])
+
+    processor.run_pre_market(_PREV_DAY_OHLC)
+    first = store.get_symbol_data("AAA")
+
+    processor.run_pre_market(_PREV_DAY_OHLC)
+    assert store.get_symbol_data("AAA") is first
+    assert store.universe_snapshots[-1].symbols_missing_prev_day_ohlc == ["CCC"]
+
+    changed = {**_PREV_DAY_OHLC, "AAA": {"high": 111.0, "low": 90.0, "close": 100.0}}
+    processor.run_pre_market(changed)
+    recomputed = store.get_symbol_data("AAA")
+    assert recomputed is not first
+    assert recomputed.prev_high == 111.0
+
+
+def test_snapshot_timestamp_comes_from_injected_clock(logger, store, universe):
+    """
+    With a ReplayClock the snapshot timestamp is the replayed time, not wall time.
+    """
+    from core.clock import ReplayClock
+
+    universe(["AAA", "BBB", "CCC"])
+
+    replay_time = datetime(2026, 1, 10, 9, 0)
+    processor = DerivedDataProcessor(
+        event_bus=_TestEventBus(), logger=logger, store=store, clock=ReplayClock(replay_time)
+    )
+    processor.run_pre_market(_PREV_DAY_OHLC)
+
+    assert store.universe_snapshots[-1].timestamp == replay_time
+
+
+def test_default_batch_persist_falls_back_to_per_record(logger, universe):
+    """
+    Stores that only implement persist_symbol_data still receive every record
+    through the base-class persist_symbol_data_batch.
+    """
+    from core.derived_data.derived_data_store import DerivedDataStore
+
+    class _RecordingStore(DerivedDataStore):
+        def __init__(self):
+            self.persisted = []
+            self.universe_snapshots = []
+
+        def persist_symbol_data(self, symbol_data):
+            self.persisted.append(symbol_data.symbol)
+
+        def persist_universe_snapshot(self, snapshot):
+            self.universe_snapshots.append(snapshot)
+
+    universe(["AAA", "BBB", "CCC"])
+
+    recording = _RecordingStore()
+    DerivedDataProcessor(event_bus=_TestEventBus(), logger=logger, store=recording).run_pre_market(
+        _PREV_DAY_OHLC
+    )
+
+    assert recording.persisted == ["AAA", "BBB"]
+
+
+def test_universe_refresh_detects_in_place_edits(processor, logger, universe):
+    """
+    Unchanged inputs skip the refresh; a same-length in-place edit does not.
+    """
+    universe(["AAA", "BBB"])
 
+    processor.universe_refresh()
+    processor.universe_refresh()
+    refreshes = [r for r in logger.records if r[0][0] == "[DERIVED] Universe refreshed"]
+    assert len(refreshes) == 1
 
-def test_gap_snapshot_emitted_on_session_start(processor, store):
+    derived_config.symbol_universe[1] = "CCC"
+    processor.universe_refresh()
+    assert processor._effective_universe == ["AAA", "CCC"]
+
+
+def test_refresh_config_applies_overrides(processor, store, universe):
+    """
+    DERIVED_CFG is read-only; per-processor overrides go through refresh_config.
+    """
+    universe(["AAA", "BBB", "CCC"])
+
+    with pytest.raises(TypeError):
+        derived_config.DERIVED_CFG["top_n"] = 0
+
+    processor.refresh_config({**derived_config.DERIVED_CFG, "top_n": 0, "target_max_pct": 1.0})
+    processor.run_pre_market(_PREV_DAY_OHLC)
+
+    assert store.universe_snapshots[-1].tradable_symbols == []
+    assert len(store.get_symbol_data("AAA").target_range_pos) == 5
+
+
+def test_snapshot_still_emitted_when_batch_persist_fails(logger, universe):
+    """
+    A failing store is logged once per run and does not block the snapshot.
+    """
+    class _FailingStore(InMemoryDerivedDataStore):
+        def persist_symbol_data_batch(self, records):
+            raise RuntimeError("store offline")
+
+    universe(["AAA", "BBB", "CCC"])
+
+    failing = _FailingStore()
+    DerivedDataProcessor(event_bus=_TestEventBus(), logger=logger, store=failing).run_pre_market(
+        _PREV_DAY_OHLC
+    )
+
+    failures = [r for r in logger.records if r[0][0] == "[DERIVED] Failed to persist symbol data"]
+    assert len(failures) == 1
+    assert failures[0][1]["error"] == "store offline"
+    assert len(failing.universe_snapshots) == 1
+
+
+def test_manually_omitted_symbols_are_excluded(processor, store, universe):
+    """
+    Symbols in manually_omitted_symbols never reach the effective universe,
+    and the omission is picked up when the config is reassigned.
+    """
+    universe(["AAA", "BBB", "CCC"], omitted={"BBB"})
+
+    processor.run_pre_market(_PREV_DAY_OHLC)
+    snap = store.universe_snapshots[-1]
+    assert snap.effective_universe == ["AAA", "CCC"]
+    assert "BBB" not in snap.filtered_symbols
+
+    universe(["AAA", "BBB", "CCC"])
+    processor.run_pre_market(_PREV_DAY_OHLC)
+    assert store.universe_snapshots[-1].effective_universe == ["AAA", "BBB", "CCC"]
+
+
+def test_gap_snapshot_emitted_on_session_start(processor, store, universe, session_start_event):
     """
     After pre-market, session start with today_open must emit gap snapshot
     for tradable symbols.
     """
-    derived_config.symbol_universe[:] = ["AAA", "BBB", "CCC"]
-    derived_config.manually_omitted_symbols = None
+    universe(["AAA", "BBB", "CCC"])
 
-    processor.run_pre_market(prev_day_ohlc_sample())
+    processor.run_pre_market(_PREV_DAY_OHLC)
 
     # Build SessionStartEvent with today_open value (take AAA prev_close + small change)
-    from datetime import datetime, timezone
-    from core.session.session_context import SessionContext
-
-    now = datetime.now(timezone.utc)
-    session_ctx = SessionContext(
-        session_date=now.date(),
-        session_start_timestamp=now,
-        session_end_timestamp=None,
-        today_open=101.0,  # opening price used for gap calc
-        prev_day_open=None,
-        prev_day_high=None,
-        prev_day_low=None,
-        prev_day_close=None,
-    )
-
-    session_event = SessionStartEvent(timestamp=now, session_context=session_ctx)
+    session_event = session_start_event(_NOW, today_open=101.0)
 
     # publish event (this should be received by processor and gap snapshot stored)
     processor._event_bus.publish(session_event)
@@ -191,31 +351,23 @@ def test_gap_snapshot_emitted_on_session_start(processor, store):
     gap = store.gap_snapshots[0]
     assert "AAA" in gap.gaps or "BBB" in gap.gaps
 
+    # AAA: prev_close 100 -> open 101 is a +1% gap
+    assert gap.gaps["AAA"]["prev_close"] == 100.0
+    assert gap.gaps["AAA"]["today_open"] == 101.0
+    assert gap.gaps["AAA"]["gap_pct"] == pytest.approx(1.0)
+    assert gap.gaps["AAA"]["gap_pct_abs"] == pytest.approx(1.0)
+
 
-def test_no_gap_emitted_when_no_tradables(processor, store):
+def test_no_gap_emitted_when_no_tradables(processor, store, universe, session_start_event):
     """
     If no tradables (e.g., missing prev-day OHLC), session start should not emit gap snapshot.
     """
     # set universe to a symbol with no prev-day data
-    derived_config.symbol_universe[:] = ["X1"]
-    derived_config.manually_omitted_symbols = None
+    universe(["X1"])
 
     processor.run_pre_market(prev_day_ohlc={})  # no prev-day OHLC at all
 
-    from datetime import datetime, timezone
-    from core.session.session_context import SessionContext
-    now = datetime.now(timezone.utc)
-    session_ctx = SessionContext(
-        session_date=now.date(),
-        session_start_timestamp=now,
-        session_end_timestamp=None,
-        today_open=10.0,
-        prev_day_open=None,
-        prev_day_high=None,
-        prev_day_low=None,
-        prev_day_close=None,
-    )
-    session_event = SessionStartEvent(timestamp=now, session_context=session_ctx)
+    session_event = session_start_event(_NOW, today_open=10.0)
 
     processor._event_bus.publish(session_event)
 
@@ -258,6 +410,11 @@ def test_get_target_by_step(store):
     assert store.get_target_by_step("AAA", 2, "neg") == 99.5
     assert store.get_target_by_step("AAA", 5, "pos") is None
 
+    batch = store.get_targets_batch("AAA", np.array([0, 2, 5, -1]), "pos")
+    assert batch[:2].tolist() == [100.0, 100.5]
+    assert np.isnan(batch[2:]).all()
+    assert store.get_targets_batch("ZZZ", np.array([0])) is None
+
 
 def test_get_flip_for_step(store):
     """
@@ -291,6 +448,37 @@ def test_get_flip_for_step(store):
     assert store.get_flip_for_step("BBB", 10, "pos") is None
 
 
+def test_symbol_data_accepts_array_buffers(store):
+    """
+    array('d') ranges are wrapped zero-copy and work with the store helpers.
+    """
+    from array import array
+
+    from core.derived_data.models import DerivedSymbolData
+
+    targets = array("d", [100.0, 100.25, 100.5])
+    record = DerivedSymbolData(
+        symbol="DDD",
+        prev_high=105.0,
+        prev_low=95.0,
+        prev_close=100.0,
+        P=100.0,
+        BC=99.0,
+        TC=101.0,
+        cpr_width_pct=0.2,
+        target_range_pos=targets,
+        target_range_neg=array("d", [100.0, 99.75, 99.5]),
+        metadata={},
+    )
+
+    assert np.shares_memory(record.target_range_pos, np.frombuffer(targets))
+
+    store.persist_symbol_data(record)
+    assert store.get_target_by_step("DDD", 1, "pos") == 100.25
+    assert store.get_target_by_step("DDD", 2, "neg") == 99.5
+    assert store.get_flip_for_step("DDD", 0, "pos") is None
+
+
 def test_get_stop_for_step(store):
     """
     Stop price must be symmetric relative to prev_close.
@@ -2,18 +2,25 @@
 # IMPORTS
 # ============================================================
 
-from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Tuple
+from datetime import datetime, timedelta, timezone
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Tuple
 
 import pytest
 
 from strategy.strategy_manager import create_strategy
-from strategy.intent_events import IntentEvent, TriggerSpec, Side
+from strategy.intent_events import IntentEvent, RejectedIntentEvent, Side
 from core.derived_data.models import GapSnapshotEvent
 from core.derived_data.derived_data_store import InMemoryDerivedDataStore
+from core.events.order_events import OrderFillEvent
 from core.events.session_events import SessionEndEvent
 
 
+# fixed wall-clock stand-ins; no test asserts on real time
+_NOW = datetime(2026, 1, 10, 9, 15, tzinfo=timezone.utc)
+_NOW_PLUS_1 = _NOW + timedelta(seconds=1)
+
+
 # ============================================================
 # SMALL TEST HELPERS (non-collectable names)
 # ============================================================
@@ -22,40 +29,47 @@ class _CaptureEventBus:
     """
     Minimal event bus used in tests.
     - subscribe(key, handler)
-    - publish(event) => dispatch to handlers where isinstance(event, key)
-    Also records a chronological list of published events (for assertions).
+    - publish(event) => dispatch to handlers of type(event) and its base classes
     """
 
     def __init__(self):
-        self._subs: Dict[Any, List[Callable]] = {}
-        self.published: List[Any] = []
+        # key: event class -> list of handlers
+        self._subs: Dict[type, List[Callable]] = {}
+        # concrete event class -> matching handlers; dropped on subscribe
+        self._resolved: Dict[type, List[Callable]] = {}
 
     def subscribe(self, key, handler: Callable):
         self._subs.setdefault(key, []).append(handler)
+        self._resolved.clear()
 
     def publish(self, event: Any):
-        # record for inspection
-        self.published.append(event)
-        # dispatch to matching subscribers
-        for key, handlers in list(self._subs.items()):
-            try:
-                # key is expected to be a class/type
-                if isinstance(event, key):
-                    for h in handlers:
-                        h(event)
-            except Exception:
-                # fallback: if key is exactly the event's class object
-                if key == type(event):
-                    for h in handlers:
-                        h(event)
+        # handlers of the event's class and its base classes, resolved once per class
+        ev_cls = type(event)
+        handlers = self._resolved.get(ev_cls)
+        if handlers is None:
+            handlers = [h for cls in ev_cls.__mro__ for h in self._subs.get(cls, ())]
+            self._resolved[ev_cls] = handlers
+        for h in handlers:
+            h(event)
+
+    def publish_event(self, event: Any):
+        self.publish(event)
+
+
+def _noop(*args, **kwargs):
+    pass
 
 
 class _TestLogger:
-    def __init__(self):
-        self.records: List[Tuple[Tuple, Dict]] = []
+    def __init__(self, capture: bool = False):
+        # bounded ring; nothing is stored (or even appended) unless capture=True
+        self.records: Deque[Tuple] = deque(maxlen=4096)
+        if not capture:
+            self.info = _noop
 
     def info(self, *args, **kwargs):
-        self.records.append((args, kwargs))
+        # store args only; keep kwargs alongside when there are any
+        self.records.append((args, kwargs) if kwargs else (args,))
 
 
 # ============================================================
@@ -87,28 +101,27 @@ def strategy(bus, logger, store):
     return s
 
 
-# ============================================================
-# HELP: find last published IntentEvent from capture bus
-# ============================================================
-
-def _find_last_intent(bus: _CaptureEventBus) -> IntentEvent:
-    for ev in reversed(bus.published):
-        if isinstance(ev, IntentEvent):
-            return ev
-    return None
+@pytest.fixture
+def intents(bus) -> List[IntentEvent]:
+    """
+    Every IntentEvent published on the bus, in order.
+    """
+    captured: List[IntentEvent] = []
+    bus.subscribe(IntentEvent, captured.append)
+    return captured
 
 
 # ============================================================
 # TESTS
 # ============================================================
 
-def test_strategy_emits_intent_on_gap_snapshot(strategy, bus, store):
+def test_strategy_emits_intent_on_gap_snapshot(strategy, bus, store, intents):
     """
     Strategy should pick the symbol with the smallest absolute gap (gap_pct_abs)
     and publish an IntentEvent with step_index == 1 (initial).
     """
     # Prepare gap snapshot with two symbols: AAA (0.2) smaller than BBB (1.0)
-    now = datetime.now(timezone.utc)
+    now = _NOW
     gaps = {
         "AAA": {"prev_close": 100.0, "today_open": 100.5, "gap_pct": 0.5, "gap_pct_abs": 0.5},
         "BBB": {"prev_close": 50.0, "today_open": 50.75, "gap_pct": 1.5, "gap_pct_abs": 1.5},
@@ -120,8 +133,8 @@ def test_strategy_emits_intent_on_gap_snapshot(strategy, bus, store):
     bus.publish(gap_event)
 
     # Find last intent published
-    intent = _find_last_intent(bus)
-    assert intent is not None, "No IntentEvent was published on GapSnapshotEvent"
+    assert intents, "No IntentEvent was published on GapSnapshotEvent"
+    intent = intents[-1]
     assert intent.symbol == "AAA", "Strategy should pick symbol with smallest gap_pct_abs"
     # Both triggers present and step_index should be 1 (first meaningful target)
     assert len(intent.triggers) == 2
@@ -130,13 +143,13 @@ def test_strategy_emits_intent_on_gap_snapshot(strategy, bus, store):
     assert {t.side for t in intent.triggers} == {Side.LONG, Side.SHORT}
 
 
-def test_strategy_auto_advance_on_order_fill(strategy, bus, store):
+def test_strategy_auto_advance_on_order_fill(strategy, bus, store, intents):
     """
     After initial intent is published, simulate an OrderFillEvent with matching intent id.
     Strategy should auto-advance and publish a new IntentEvent with step_index + 1.
     """
 
-    now = datetime.now(timezone.utc)
+    now = _NOW
     gaps = {
         "X1": {"prev_close": 10.0, "today_open": 10.2, "gap_pct": 2.0, "gap_pct_abs": 2.0},
         "X2": {"prev_close": 20.0, "today_open": 20.5, "gap_pct": 2.5, "gap_pct_abs": 2.5},
@@ -145,40 +158,67 @@ def test_strategy_auto_advance_on_order_fill(strategy, bus, store):
 
     # Publish gap snapshot -> initial intent for X1
     bus.publish(gap_event)
-    first_intent = _find_last_intent(bus)
-    assert first_intent is not None
+    assert intents
+    first_intent = intents[-1]
     first_id = first_intent.intent_id
     assert first_intent.triggers[0].step_index == 1
 
-    # Create a dummy "OrderFillEvent" shaped object that carries intent_id
-    class DummyFill:
-        def __init__(self, intent_id):
-            self.intent_id = intent_id
-            # other fields that OrderFillEvent might have are ignored by DummyStrategy
-
-    fill = DummyFill(first_id)
+    fill = OrderFillEvent(intent_id=first_id, symbol="X1", qty=1.0, price=10.2)
 
     # publish the fill -> strategy should handle and emit next intent
     bus.publish(fill)
 
-    # find the next IntentEvent (should be after the fill in the published list)
-    # search for an IntentEvent whose id != first_id
-    found_next = None
-    for ev in reversed(bus.published):
-        if isinstance(ev, IntentEvent) and ev.intent_id != first_id:
-            found_next = ev
-            break
-
-    assert found_next is not None, "Strategy did not publish the next Intent after OrderFill"
+    # the next IntentEvent is the one published after the fill
+    assert len(intents) == 2, "Strategy did not publish the next Intent after OrderFill"
+    found_next = intents[-1]
+    assert found_next.intent_id != first_id
     # Step index should have advanced to 2
     assert found_next.triggers[0].step_index == 2
 
 
-def test_strategy_deactivates_on_session_end(strategy, bus, store):
+def test_strategy_ignores_intent_lifecycle_events(strategy, bus, store, intents):
+    """
+    Rejected / expired / approved events carry the active intent, but only an
+    OrderFillEvent may advance the step.
+    """
+    gaps = {
+        "AAA": {"prev_close": 100.0, "today_open": 100.5, "gap_pct": 0.5, "gap_pct_abs": 0.5},
+    }
+    bus.publish(GapSnapshotEvent(timestamp=_NOW, gaps=gaps))
+    assert len(intents) == 1
+
+    bus.publish(RejectedIntentEvent(intent=intents[0], reason="Capital limit"))
+
+    assert len(intents) == 1, "Strategy advanced to step 2 on a RejectedIntentEvent"
+
+
+def test_strategy_ignores_non_fill_events_carrying_the_intent_id(strategy, bus, store, intents):
+    """
+    Only an OrderFillEvent advances the step, even if another event delivered
+    to the fill handler exposes the active intent id.
+    """
+    gaps = {
+        "AAA": {"prev_close": 100.0, "today_open": 100.5, "gap_pct": 0.5, "gap_pct_abs": 0.5},
+    }
+    bus.publish(GapSnapshotEvent(timestamp=_NOW, gaps=gaps))
+
+    class NotAFill:
+        def __init__(self, intent):
+            self.intent = intent
+            self.origin_intent_id = intent.intent_id
+
+    strategy._on_order_fill(NotAFill(intents[0]))
+    assert len(intents) == 1
+
+    bus.publish(OrderFillEvent(intent_id=intents[0].intent_id))
+    assert len(intents) == 2
+
+
+def test_strategy_deactivates_on_session_end(strategy, bus, store, intents):
     """
     After SessionEndEvent, strategy should deactivate and ignore subsequent gap snapshots.
     """
-    now = datetime.now(timezone.utc)
+    now = _NOW
     gaps1 = {
         "A": {"prev_close": 100.0, "today_open": 100.0, "gap_pct": 0.0, "gap_pct_abs": 0.0},
     }
@@ -186,23 +226,38 @@ def test_strategy_deactivates_on_session_end(strategy, bus, store):
 
     # Publish first gap -> initial intent
     bus.publish(gap_event1)
-    first_intent = _find_last_intent(bus)
-    assert first_intent is not None
+    assert len(intents) == 1
 
     # Publish session end
     session_end = SessionEndEvent(timestamp=now, session_context=None)
     bus.publish(session_end)
 
-    # Clear previously published intents for clarity
-    bus.published.clear()
-
     # Publish another gap snapshot after session end
     gaps2 = {
         "B": {"prev_close": 50.0, "today_open": 50.0, "gap_pct": 0.0, "gap_pct_abs": 0.0},
     }
-    gap_event2 = GapSnapshotEvent(timestamp=datetime.now(timezone.utc), gaps=gaps2)
+    gap_event2 = GapSnapshotEvent(timestamp=_NOW_PLUS_1, gaps=gaps2)
     bus.publish(gap_event2)
 
     # No new IntentEvents should be published after deactivation
-    intents_after = [e for e in bus.published if isinstance(e, IntentEvent)]
-    assert len(intents_after) == 0, "Strategy published intents after SessionEndEvent (should be deactivated)"
+    assert len(intents) == 1, (
+        "Strategy published intents after SessionEndEvent (should be deactivated)"
+    )
+
+
+def test_strategy_intent_ids_use_sequence_counter(strategy, bus, store, intents):
+    """
+    Intent ids are strategy:symbol:step:seq, with seq increasing per emitted intent.
+    """
+    gaps = {
+        "AAA": {"prev_close": 100.0, "today_open": 100.5, "gap_pct": 0.5, "gap_pct_abs": 0.5},
+    }
+    bus.publish(GapSnapshotEvent(timestamp=_NOW, gaps=gaps))
+    first_id = intents[-1].intent_id
+
+    bus.publish(OrderFillEvent(intent_id=first_id))
+    second_id = intents[-1].intent_id
+
+    assert first_id == "DUMMY-TEST:AAA:step1:1"
+    assert second_id == "DUMMY-TEST:AAA:step2:2"
+    assert intents[-1].created_at.tzinfo is timezone.utc
@@ -11,3 +11,173 @@ def test_event_bus_publish_delivers_to_subscriber():
     bus.publish("TestEvent", {"value": 42})
 
     assert received_payloads == [{"value": 42}]
+
+
+def test_event_bus_publish_dispatches_on_event_class():
+    class SampleEvent:
+        pass
+
+    bus = EventBus()
+    received = []
+
+    bus.subscribe(SampleEvent, received.append)
+    bus.subscribe("SampleEvent", lambda payload: received.append("by-name"))
+
+    event = SampleEvent()
+    bus.publish(event)
+
+    assert received == [event]
+
+
+def test_event_bus_handlers_run_in_subscription_order():
+    bus = EventBus()
+    calls = []
+
+    bus.subscribe("TestEvent", lambda payload: calls.append(("first", payload)))
+    bus.subscribe("TestEvent", lambda payload: calls.append(("second", payload)))
+    bus.publish("TestEvent", 1)
+
+    assert calls == [("first", 1), ("second", 1)]
+
+
+def test_event_bus_class_subscription_receives_subclasses():
+    class BaseEvent:
+        pass
+
+    class ChildEvent(BaseEvent):
+        pass
+
+    bus = EventBus()
+    received = []
+
+    bus.publish(ChildEvent())  # resolved (empty) before anyone subscribes
+    bus.subscribe(BaseEvent, received.append)
+
+    child = ChildEvent()
+    bus.publish(child)
+
+    assert received == [child]
+
+
+def test_publish_topic_and_publish_event_are_specialized_paths():
+    class SampleEvent:
+        pass
+
+    bus = EventBus()
+    received = []
+    bus.subscribe("SampleEvent", lambda payload: received.append(("topic", payload)))
+    bus.subscribe(SampleEvent, lambda event: received.append(("class", event)))
+
+    event = SampleEvent()
+    bus.publish_topic("SampleEvent", 1)
+    bus.publish_event(event)
+
+    assert received == [("topic", 1), ("class", event)]
+
+
+def test_publish_many_delivers_each_payload_in_order():
+    bus = EventBus()
+    received = []
+    bus.subscribe("TickEvent", received.append)
+    bus.subscribe("TickEvent", lambda payload: received.append(-payload))
+
+    bus.publish_many("TickEvent", [1, 2])
+
+    assert received == [1, -1, 2, -2]
+
+
+def test_unsubscribe_removes_handler_from_topic_and_class_dispatch():
+    class SampleEvent:
+        pass
+
+    bus = EventBus()
+    received = []
+
+    bus.subscribe("TickEvent", received.append)
+    bus.subscribe(object, received.append)
+
+    bus.publish(SampleEvent())  # resolve the class cache before unsubscribing
+    bus.unsubscribe(object, received.append)
+    bus.unsubscribe("TickEvent", received.append)
+    bus.unsubscribe("TickEvent", received.append)  # already gone: no-op
+
+    bus.publish(SampleEvent())
+    bus.publish("TickEvent", 1)
+
+    assert len(received) == 1
+
+
+def test_single_handler_fast_path_promotes_to_tuple_on_second_subscribe():
+    class SampleEvent:
+        pass
+
+    bus = EventBus()
+    calls = []
+
+    bus.subscribe("TickEvent", lambda payload: calls.append(("only", payload)))
+    bus.subscribe(SampleEvent, lambda event: calls.append("event-only"))
+    bus.publish("TickEvent", 1)
+    bus.publish(SampleEvent())
+
+    bus.subscribe("TickEvent", lambda payload: calls.append(("second", payload)))
+    bus.subscribe(object, lambda event: calls.append("event-base"))
+    bus.publish("TickEvent", 2)
+    bus.publish(SampleEvent())
+
+    assert calls == [
+        ("only", 1), "event-only",
+        ("only", 2), ("second", 2), "event-only", "event-base",
+    ]
+
+
+def test_channel_handle_tracks_later_subscriptions():
+    bus = EventBus()
+    received = []
+
+    ch = bus.channel("TickEvent")
+    bus.publish_ch(ch, 0)  # no subscribers yet
+
+    bus.subscribe("TickEvent", received.append)
+    bus.publish_ch(ch, 1)
+    bus.subscribe("TickEvent", lambda payload: received.append(-payload))
+    bus.publish_ch(ch, 2)
+    bus.unsubscribe("TickEvent", received.append)
+    bus.publish_ch(ch, 3)
+
+    assert bus.channel("TickEvent") == ch
+    assert bus.channel("CandleUpdateEvent") != ch
+    assert received == [1, 2, -2, -3]
+
+
+def test_reset_drops_all_subscriptions_and_keeps_channels_usable():
+    class SampleEvent:
+        pass
+
+    bus = EventBus()
+    received = []
+
+    ch = bus.channel("TickEvent")
+    bus.subscribe("TickEvent", received.append)
+    bus.subscribe(SampleEvent, received.append)
+    bus.publish(SampleEvent())  # fill the resolved cache
+
+    bus.reset()
+    bus.publish_ch(ch, 1)
+    bus.publish("TickEvent", 2)
+    bus.publish(SampleEvent())
+    assert len(received) == 1
+
+    bus.subscribe("TickEvent", received.append)
+    bus.publish_ch(ch, 3)
+    assert received[1:] == [3]
+
+
+def test_conftest_bus_mirrors_publish_many_and_unsubscribe(event_bus):
+    received = []
+
+    event_bus.subscribe("TickEvent", received.append)
+    event_bus.publish_many("TickEvent", [1, 2])
+    event_bus.unsubscribe("TickEvent", received.append)
+    event_bus.publish_ch(event_bus.channel("TickEvent"), 3)
+
+    assert received == [1, 2]
@@ -1,9 +1,11 @@
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from core.event_bus import EventBus
 from core.clock import ReplayClock
 from core.logger import Logger
-from data.fake_tick_generator import FakeTickGenerator
+from data.fake_tick_generator import RNG_BUFFER_SIZE, FakeTickGenerator
 
 def test_fake_tick_emits_event():
     bus = EventBus()
@@ -81,3 +83,38 @@ def test_fake_tick_deterministic_with_seed():
     gen2.emit_tick()
 
     assert prices_1 == prices_2
+
+
+def test_fake_tick_sequence_follows_seeded_buffers_across_refill():
+    bus = EventBus()
+    clock = ReplayClock(datetime(2024, 1, 1, 9, 15))
+    received = []
+    bus.subscribe("TickEvent", received.append)
+
+    gen = FakeTickGenerator(
+        symbol="TEST",
+        start_price=100.0,
+        event_bus=bus,
+        clock=clock,
+        logger=Logger("logger_seq"),
+        seed=7,
+    )
+    n = RNG_BUFFER_SIZE + 3
+    for _ in range(n):
+        gen.emit_tick()
+
+    rng = np.random.default_rng(7)
+    deltas = rng.uniform(-1.0, 1.0, size=RNG_BUFFER_SIZE).tolist()
+    volumes = rng.integers(1, 101, size=RNG_BUFFER_SIZE).tolist()
+    deltas += rng.uniform(-1.0, 1.0, size=RNG_BUFFER_SIZE).tolist()
+    volumes += rng.integers(1, 101, size=RNG_BUFFER_SIZE).tolist()
+
+    price = 100.0
+    expected = []
+    for delta, volume in zip(deltas[:n], volumes[:n]):
+        price = max(0.01, price + delta)
+        expected.append((round(price, 2), volume))
+
+    assert [(t["price"], t["volume"]) for t in received] == expected
+    assert all(type(t["volume"]) is int and type(t["price"]) is float for t in received)
+
@@ -83,3 +83,23 @@ def test_intent_lifecycle_events():
     assert approved.intent.intent_id == "TEST-2"
     assert rejected.reason == "Capital limit"
     assert expired.reason == "Timeout"
+
+
+# ============================================================
+# TEST: Events are immutable value objects
+# ============================================================
+
+def test_intent_events_are_frozen_and_slotted():
+    import pytest
+    from dataclasses import FrozenInstanceError
+
+    trigger = TriggerSpec(side=Side.LONG, step_index=1)
+    intent = IntentEvent(intent_id="TEST-3", strategy_id="DUMMY", symbol="CCC", triggers=[trigger])
+
+    with pytest.raises(FrozenInstanceError):
+        intent.symbol = "DDD"
+    with pytest.raises(FrozenInstanceError):
+        trigger.step_index = 2
+
+    assert not hasattr(intent, "__dict__")
+    assert not hasattr(ApprovedIntentEvent(intent=intent, approved_by="RiskManager"), "__dict__")
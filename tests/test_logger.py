@@ -1,6 +1,18 @@
+import pytest
+
 from core.logger import Logger
 
 
+@pytest.fixture(autouse=True)
+def _restore_correlation_id():
+    # the correlation id is context-wide, not per Logger; keep it per test
+    from core.logger import _CID
+
+    token = _CID.set("")
+    yield
+    _CID.reset(token)
+
+
 def test_logger_basic_info_does_not_crash():
     logger = Logger("test_logger")
     logger.info("Test message")
@@ -15,3 +27,100 @@ def test_logger_with_correlation_id():
     logger = Logger("test_logger_cid")
     logger.set_correlation_id("CID-001")
     logger.info("Order filled", order_id="ORD123")
+
+
+def test_logger_formats_context_and_correlation_id():
+    logger = Logger("test_logger_format")
+    logger.set_correlation_id("CID-002")
+
+    assert logger._format("Order filled", {"order_id": "ORD1", "qty": 5}) == (
+        "Order filled | cid=CID-002 order_id=ORD1 qty=5"
+    )
+
+
+def test_logger_skips_formatting_when_level_disabled():
+    import logging
+
+    class _Exploding:
+        def __str__(self):
+            raise AssertionError("context formatted although INFO is disabled")
+
+    logger = Logger("test_logger_disabled")
+    logging.getLogger("test_logger_disabled").setLevel(logging.WARNING)
+
+    logger.info("Dropped", value=_Exploding())
+
+
+def test_logger_enabled_for_follows_level():
+    import logging
+
+    logger = Logger("test_logger_enabled_for")
+    logging.getLogger("test_logger_enabled_for").setLevel(logging.WARNING)
+
+    assert not logger.enabled_for("INFO")
+    assert logger.enabled_for("ERROR")
+    assert logger.enabled_for(logging.ERROR)
+    with pytest.raises(ValueError):
+        logger.enabled_for("TRACE")
+
+
+def test_tick_logger_is_noop_when_disabled_by_env(monkeypatch, logger_factory):
+    from core.logger import LOG_TICKS_ENV, tick_logger
+
+    logger = logger_factory(capture=True)
+
+    monkeypatch.setenv(LOG_TICKS_ENV, "0")
+    tick_logger(logger)("Tick emitted", "TEST", 1.0, 5, None)
+    assert len(logger.records) == 0
+
+    monkeypatch.delenv(LOG_TICKS_ENV)
+    tick_logger(logger)("Tick emitted", "TEST", 1.0, 5, None)
+    assert list(logger.records) == [("INFO", "Tick emitted", ("TEST", 1.0, 5, None))]
+
+
+def test_log_tick_matches_keyword_info_output(caplog):
+    import logging
+
+    logger = Logger("test_log_tick")
+    logger.set_correlation_id("CID-003")
+
+    with caplog.at_level(logging.INFO, logger="test_log_tick"):
+        logger.log_tick("Tick emitted", "TEST", 101.5, 7, "09:15")
+
+    assert caplog.records[-1].getMessage() == logger._format(
+        "Tick emitted", {"symbol": "TEST", "price": 101.5, "volume": 7, "timestamp": "09:15"}
+    )
+
+
+def test_info_kv_matches_keyword_info_output(caplog):
+    import logging
+
+    logger = Logger("test_logger_info_kv")
+    logger.set_correlation_id("cid-7")
+
+    with caplog.at_level(logging.INFO, logger="test_logger_info_kv"):
+        logger.info_kv("Batch replayed", "ticks", 3, "candles", 2)
+        logger.info("Batch replayed", ticks=3, candles=2)
+        logger.info_kv("Replay finished")
+        logger.info("Replay finished")
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert messages[0] == messages[1] == "Batch replayed | cid=cid-7 ticks=3 candles=2"
+    assert messages[2] == messages[3]
+
+
+def test_correlation_id_is_shared_across_loggers_but_scoped_to_context():
+    import contextvars
+
+    first = Logger("test_logger_cid_first")
+    second = Logger("test_logger_cid_second")
+
+    def in_other_context():
+        second.set_correlation_id("CID-OTHER")
+        return second._format("x", {})
+
+    first.set_correlation_id("CID-004")
+
+    assert second._format("x", {}) == "x | cid=CID-004"
+    assert contextvars.copy_context().run(in_other_context) == "x | cid=CID-OTHER"
+    assert first._format("x", {}) == "x | cid=CID-004"
@@ -2,7 +2,9 @@ from datetime import datetime
 
 from core.event_bus import EventBus
 from core.clock import ReplayClock
+from core.events.candle_events import CandleClosedEvent
 from core.logger import Logger
+from data.candle_builder import CandleBuilder
 from data.replay_loader import ReplayLoader
 
 def test_replay_loader_emits_ticks_in_order():
@@ -54,3 +56,103 @@ def test_replay_loader_emits_ticks_in_order():
         (100.0, datetime(2024, 1, 1, 9, 15)),
         (101.0, datetime(2024, 1, 1, 9, 16)),
     ]
+
+
+def test_replay_batch_matches_streaming_candle_builder():
+    raw = [
+        ("AAA", 100.0, 10, datetime(2024, 1, 1, 9, 15, 5)),
+        ("BBB", 50.0, 3, datetime(2024, 1, 1, 9, 15, 10)),
+        ("AAA", 102.0, 5, datetime(2024, 1, 1, 9, 15, 40)),
+        ("AAA", 99.0, 1, datetime(2024, 1, 1, 9, 15, 50)),
+        ("BBB", 51.0, 4, datetime(2024, 1, 1, 9, 16, 2)),
+        ("AAA", 101.0, 7, datetime(2024, 1, 1, 9, 16, 30)),
+        ("AAA", 103.0, 2, datetime(2024, 1, 1, 9, 17, 0)),
+        ("BBB", 52.0, 1, datetime(2024, 1, 1, 9, 17, 1)),
+    ]
+
+    def ticks():
+        return [
+            {"symbol": s, "price": p, "volume": v, "timestamp": t} for s, p, v, t in raw
+        ]
+
+    def key(candle):
+        return (candle.symbol, candle.start_time, candle.end_time,
+                candle.open, candle.high, candle.low, candle.close, candle.volume)
+
+    # streaming reference
+    stream_bus = EventBus()
+    streamed = []
+    stream_bus.subscribe(CandleClosedEvent, streamed.append)
+    CandleBuilder(event_bus=stream_bus, logger=Logger("stream"))
+    for tick in ticks():
+        stream_bus.publish("TickEvent", tick)
+
+    # batched replay; batch size splits the 9:15 and 9:16 minutes
+    bus = EventBus()
+    batched = []
+    per_tick = []
+    bus.subscribe(CandleClosedEvent, batched.append)
+    bus.subscribe("TickEvent", per_tick.append)
+    clock = ReplayClock(datetime(2024, 1, 1, 9, 0))
+    replay = ReplayLoader(ticks=iter(ticks()), event_bus=bus, clock=clock, logger=Logger("batch"))
+
+    while replay.replay_batch(3):
+        pass
+
+    assert per_tick == []
+    assert sorted(map(key, batched[:-2])) == sorted(map(key, streamed))
+    # last minute is flushed when the recording runs out
+    assert [key(c)[:2] for c in batched[-2:]] == [
+        ("AAA", datetime(2024, 1, 1, 9, 17)),
+        ("BBB", datetime(2024, 1, 1, 9, 17)),
+    ]
+    assert clock.now() == datetime(2024, 1, 1, 9, 17, 1)
+
+
+def test_replay_batch_keeps_timezone_of_aware_ticks():
+    import warnings
+    from datetime import timedelta, timezone
+
+    ist = timezone(timedelta(hours=5, minutes=30))
+    raw = [
+        ("AAA", 100.0, 1.5, datetime(2024, 1, 1, 9, 15, 5, tzinfo=ist)),
+        ("AAA", 101.0, 2.25, datetime(2024, 1, 1, 9, 15, 30, tzinfo=ist)),
+        ("AAA", 99.5, 0.5, datetime(2024, 1, 1, 9, 16, 1, tzinfo=ist)),
+        ("AAA", 100.5, 1.0, datetime(2024, 1, 1, 9, 17, 0, tzinfo=ist)),
+    ]
+
+    def ticks():
+        return iter([
+            {"symbol": s, "price": p, "volume": v, "timestamp": t} for s, p, v, t in raw
+        ])
+
+    def key(candle):
+        return (candle.symbol, candle.start_time, candle.start_time.utcoffset(),
+                candle.end_time, candle.open, candle.high, candle.low,
+                candle.close, candle.volume)
+
+    def replay(drive):
+        bus = EventBus()
+        candles = []
+        bus.subscribe(CandleClosedEvent, candles.append)
+        clock = ReplayClock(datetime(2024, 1, 1, 9, 0, tzinfo=ist))
+        loader = ReplayLoader(ticks=ticks(), event_bus=bus, clock=clock, logger=Logger("tz"))
+        if drive == "stream":
+            CandleBuilder(event_bus=bus, logger=Logger("tz"))
+            while loader.replay_next():
+                pass
+        else:
+            while loader.replay_batch(2):
+                pass
+        return candles
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        batched = replay("batch")
+    streamed = replay("stream")
+
+    assert batched[0].start_time == datetime(2024, 1, 1, 9, 15, tzinfo=ist)
+    assert batched[0].start_time.tzinfo == ist
+    assert batched[0].volume == 3.75
+    # streaming never closes the last minute; the batch flushes it
+    assert [key(c) for c in batched[:-1]] == [key(c) for c in streamed]
@@ -2,9 +2,13 @@
 # IMPORTS
 # ============================================================
 
+from dataclasses import FrozenInstanceError
 from datetime import datetime
-from types import SimpleNamespace
 
+import numpy as np
+import pytest
+
+from core.events.candle_events import Candle
 from core.session.session_boundary_detector import SessionBoundaryDetector
 from core.events.session_events import SessionStartEvent, SessionEndEvent
 
@@ -18,13 +22,7 @@ def candle_event(timestamp, o, h, l, c):
     Build a minimal CandleClosedEvent-like object for testing.
     Uses explicit timestamps to guarantee determinism.
     """
-    return SimpleNamespace(
-        timestamp=timestamp,
-        open=o,
-        high=h,
-        low=l,
-        close=c,
-    )
+    return Candle(timestamp, o, h, l, c)
 
 
 # ============================================================
@@ -38,10 +36,11 @@ def test_single_day_session_emits_start_only(event_bus, logger):
     - No SessionEndEvent
     """
 
-    captured_events = []
+    starts = []
+    ends = []
 
-    event_bus.subscribe(SessionStartEvent, lambda e: captured_events.append(e))
-    event_bus.subscribe(SessionEndEvent, lambda e: captured_events.append(e))
+    event_bus.subscribe(SessionStartEvent, starts.append)
+    event_bus.subscribe(SessionEndEvent, ends.append)
 
     detector = SessionBoundaryDetector(event_bus, logger)
 
@@ -53,9 +52,6 @@ def test_single_day_session_emits_start_only(event_bus, logger):
         candle_event(datetime(2026, 1, 10, 9, 16), 104, 106, 103, 105)
     )
 
-    starts = [e for e in captured_events if isinstance(e, SessionStartEvent)]
-    ends = [e for e in captured_events if isinstance(e, SessionEndEvent)]
-
     assert len(starts) == 1
     assert len(ends) == 0
 
@@ -68,10 +64,11 @@ def test_two_day_boundary_emits_end_and_next_start(event_bus, logger):
     - Previous day OHLC correctly transferred
     """
 
-    captured_events = []
+    starts = []
+    ends = []
 
-    event_bus.subscribe(SessionStartEvent, lambda e: captured_events.append(e))
-    event_bus.subscribe(SessionEndEvent, lambda e: captured_events.append(e))
+    event_bus.subscribe(SessionStartEvent, starts.append)
+    event_bus.subscribe(SessionEndEvent, ends.append)
 
     detector = SessionBoundaryDetector(event_bus, logger)
 
@@ -88,9 +85,6 @@ def test_two_day_boundary_emits_end_and_next_start(event_bus, logger):
         candle_event(datetime(2026, 1, 11, 9, 15), 120, 121, 119, 120)
     )
 
-    starts = [e for e in captured_events if isinstance(e, SessionStartEvent)]
-    ends = [e for e in captured_events if isinstance(e, SessionEndEvent)]
-
     assert len(starts) == 2
     assert len(ends) == 1
 
@@ -101,6 +95,85 @@ def test_two_day_boundary_emits_end_and_next_start(event_bus, logger):
     assert day2_context.prev_day_low == 95
     assert day2_context.prev_day_close == 110
 
+    # end snapshot is finalized; the day-1 start snapshot is left as published
+    assert ends[0].session_context.session_end_timestamp == datetime(2026, 1, 10, 15, 29)
+    assert starts[0].session_context.session_end_timestamp is None
+
+    # published events are immutable, so subscribers may keep them as-is
+    with pytest.raises(FrozenInstanceError):
+        starts[0].timestamp = datetime(2026, 1, 12, 9, 15)
+
+
+def test_prev_day_ohlc_folds_extremes_from_any_candle(event_bus, logger):
+    """
+    Day high/low come from whichever candle set them, not the first or last.
+    """
+    starts = []
+    event_bus.subscribe(SessionStartEvent, starts.append)
+
+    detector = SessionBoundaryDetector(event_bus, logger)
+
+    for c in [
+        candle_event(datetime(2026, 1, 10, 9, 15), 100, 101, 99, 100),
+        candle_event(datetime(2026, 1, 10, 11, 0), 100, 108, 97, 102),   # day high
+        candle_event(datetime(2026, 1, 10, 13, 0), 102, 103, 90, 95),    # day low
+        candle_event(datetime(2026, 1, 10, 15, 29), 95, 99, 94, 98),
+        candle_event(datetime(2026, 1, 11, 9, 15), 99, 100, 98, 99),
+    ]:
+        detector.on_candle_closed(c)
+
+    ctx = starts[-1].session_context
+    assert (ctx.prev_day_open, ctx.prev_day_high, ctx.prev_day_low, ctx.prev_day_close) == (
+        100, 108, 90, 98
+    )
+
+
+def test_on_candles_matches_one_at_a_time_feed(event_bus_factory, logger_factory):
+    """
+    Batch on_candles, split so a day runs across two batches, publishes the
+    same events as on_candle_closed per candle.
+    """
+    candles = [
+        candle_event(datetime(2026, 1, 10, 9, 15), 100, 101, 99, 100),
+        candle_event(datetime(2026, 1, 10, 11, 0), 100, 108, 97, 102),
+        candle_event(datetime(2026, 1, 11, 9, 15), 99, 100, 98, 99),
+        candle_event(datetime(2026, 1, 11, 13, 0), 99, 104, 90, 95),
+        candle_event(datetime(2026, 1, 12, 9, 15), 96, 97, 95, 96),
+    ]
+
+    def run(feed):
+        bus = event_bus_factory()
+        emitted = []
+        bus.subscribe(SessionStartEvent, emitted.append)
+        bus.subscribe(SessionEndEvent, emitted.append)
+        feed(SessionBoundaryDetector(bus, logger_factory()))
+        return [(type(e).__name__, e.timestamp, e.session_context) for e in emitted]
+
+    def one_at_a_time(detector):
+        for c in candles:
+            detector.on_candle_closed(c)
+
+    def batched(detector):
+        for part in (candles[:3], candles[3:]):
+            detector.on_candles(
+                [c.timestamp for c in part],
+                [c.open for c in part], [c.high for c in part],
+                [c.low for c in part], [c.close for c in part],
+            )
+
+    def batched_datetime64(detector):
+        detector.on_candles(
+            np.array([c.timestamp for c in candles], dtype="datetime64[ns]"),
+            np.array([c.open for c in candles], dtype=np.float64),
+            np.array([c.high for c in candles], dtype=np.float64),
+            np.array([c.low for c in candles], dtype=np.float64),
+            np.array([c.close for c in candles], dtype=np.float64),
+        )
+
+    expected = run(one_at_a_time)
+    assert run(batched) == expected
+    assert run(batched_datetime64) == expected
+
 
 def test_session_boundary_detector_is_deterministic(event_bus_factory, logger_factory):
     """
@@ -136,3 +209,32 @@ def test_session_boundary_detector_is_deterministic(event_bus_factory, logger_fa
         return emitted
 
     assert run_once() == run_once()
+
+
+def test_detector_consumes_candles_from_candle_builder(logger):
+    """
+    CandleBuilder -> CandleClosedEvent -> SessionBoundaryDetector over the real EventBus.
+    """
+    from core.event_bus import EventBus
+    from data.candle_builder import CandleBuilder
+
+    bus = EventBus()
+    starts = []
+    bus.subscribe(SessionStartEvent, starts.append)
+
+    CandleBuilder(event_bus=bus, logger=logger)
+    SessionBoundaryDetector(bus, logger)
+
+    for ts, price in [
+        (datetime(2026, 1, 10, 9, 15, 5), 100.0),
+        (datetime(2026, 1, 10, 9, 16, 5), 101.0),   # closes 09:15 candle (day 1)
+        (datetime(2026, 1, 11, 9, 15, 5), 110.0),   # closes 09:16 candle (day 1)
+        (datetime(2026, 1, 11, 9, 16, 5), 111.0),   # closes day-2 09:15 candle
+    ]:
+        bus.publish("TickEvent", {"symbol": "TEST", "price": price, "volume": 1, "timestamp": ts})
+
+    assert [e.session_context.session_date for e in starts] == [
+        datetime(2026, 1, 10).date(),
+        datetime(2026, 1, 11).date(),
+    ]
+    assert starts[1].session_context.prev_day_close == 101.0
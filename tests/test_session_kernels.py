@@ -0,0 +1,46 @@
+import numpy as np
+
+from core.session import kernels
+
+
+def test_session_segments_splits_runs_and_folds_ohlc():
+    ts_ord = np.array([10, 10, 10, 11, 11, 13], dtype=np.int64)
+    o = np.array([100.0, 101.0, 102.0, 200.0, 201.0, 300.0])
+    h = np.array([101.0, 108.0, 103.0, 205.0, 202.0, 301.0])
+    lo = np.array([99.0, 100.0, 90.0, 199.0, 195.0, 299.0])
+    c = np.array([100.5, 102.0, 98.0, 201.0, 196.0, 300.5])
+
+    start_idx, end_idx, ohlc = kernels.session_segments(ts_ord, o, h, lo, c)
+
+    assert start_idx.tolist() == [0, 3, 5]
+    assert end_idx.tolist() == [2, 4, 5]
+    assert ohlc.tolist() == [
+        [100.0, 108.0, 90.0, 98.0],
+        [200.0, 205.0, 195.0, 196.0],
+        [300.0, 301.0, 299.0, 300.5],
+    ]
+
+
+def test_session_segments_loop_matches_numpy_reference():
+    rng = np.random.default_rng(11)
+    ts_ord = np.sort(rng.integers(738000, 738020, size=256)).astype(np.int64)
+    o, h, lo, c = rng.uniform(50.0, 150.0, size=(4, 256))
+
+    # the loop body Numba compiles; plain Python without Numba
+    got = kernels._session_segments_loop(ts_ord, o, h, lo, c)
+    expected = kernels._session_segments_numpy(ts_ord, o, h, lo, c)
+
+    for g, e in zip(got, expected):
+        assert np.array_equal(g, e)
+
+
+def test_session_segments_empty_input_gives_empty_outputs():
+    ts_ord = np.empty(0, dtype=np.int64)
+    empty = np.empty(0)
+
+    for impl in (kernels.session_segments, kernels._session_segments_loop,
+                 kernels._session_segments_numpy):
+        start_idx, end_idx, ohlc = impl(ts_ord, empty, empty, empty, empty)
+        assert start_idx.shape == (0,) and start_idx.dtype == np.int64
+        assert end_idx.shape == (0,) and end_idx.dtype == np.int64
+        assert ohlc.shape == (0, 4)